@@ -24,12 +24,22 @@ def pytest(session: nox.Session) -> None:
         Run specific tests:
         $ nox -s pytest -- -xvs tests/test_filesystem.py::test_discover_actions_in_paths
 
+        Run tests serially, e.g. to debug with pdb:
+        $ nox -s pytest -- -n 0
+
     """
     # Install project and dependencies
     session.install("-e", ".")
     # Install testing dependencies
     session.install(
-        "pytest", "pytest_cov", "pytest_mock", "pyfakefs", "pytest-timeout", "rpyc>=6.0.0", "pytest-asyncio"
+        "pytest",
+        "pytest_cov",
+        "pytest_mock",
+        "pyfakefs",
+        "pytest-timeout",
+        "pytest-xdist",
+        "rpyc>=6.0.0",
+        "pytest-asyncio",
     )
     test_root = os.path.join(THIS_ROOT, "tests")
 
@@ -43,6 +53,7 @@ def pytest(session: nox.Session) -> None:
         "--cov-report=term",
         "--timeout=30",  # set timeout to 30 seconds
         "--timeout-method=thread",  # Use thread method to handle timeout
+        "-n=auto",  # Spread tests across all CPU cores with pytest-xdist
         f"--rootdir={test_root}",
     ]
 
@@ -5,6 +5,7 @@ remote calls with connection management, timeout handling, and automatic reconne
 """
 
 # Import built-in modules
+from functools import partial
 import logging
 from typing import Any
 from typing import Optional
@@ -17,6 +18,7 @@ from dcc_mcp_ipc.discovery import FileDiscoveryStrategy
 from dcc_mcp_ipc.discovery import ServiceRegistry
 from dcc_mcp_ipc.discovery import ZEROCONF_AVAILABLE
 from dcc_mcp_ipc.discovery import ZeroConfDiscoveryStrategy
+from dcc_mcp_ipc.utils import connect_nodelay
 from dcc_mcp_ipc.utils import execute_remote_command as _execute_remote_command
 
 # Configure logging
@@ -57,7 +59,7 @@ class BaseApplicationClient:
         self.app_name = app_name.lower()
         self.host = host
         self.port = port
-        self.connection = None
+        self.connection: Optional[rpyc.Connection] = None
         self.connection_timeout = connection_timeout
         self.registry_path = registry_path
         self.use_zeroconf = use_zeroconf and ZEROCONF_AVAILABLE
@@ -132,7 +134,7 @@ class BaseApplicationClient:
 
         Args:
         ----
-            rpyc_connect_func: Optional function to use for connecting (default: None, uses rpyc.connect)
+            rpyc_connect_func: Optional function to use for connecting (default: None, uses connect_nodelay)
 
         Returns:
         -------
@@ -147,8 +149,9 @@ class BaseApplicationClient:
             logger.warning(f"Cannot connect to {self.app_name} service: host or port not specified")
             return False
 
-        # Use provided connect function or default to rpyc.connect
-        connect_func = rpyc_connect_func or rpyc.connect
+        # Use provided connect function or default to an rpyc.connect equivalent with TCP_NODELAY and
+        # keep-alive set, so a dead server is noticed without waiting on OS-default timeouts
+        connect_func = rpyc_connect_func or partial(connect_nodelay, keepalive=True)
 
         try:
             logger.info(f"Connecting to {self.app_name} service at {self.host}:{self.port}")
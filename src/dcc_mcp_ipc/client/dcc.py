@@ -9,10 +9,12 @@ from contextlib import contextmanager
 import logging
 from typing import Any
 from typing import Callable
+from typing import Optional
 from typing import TypeVar
 
 # Import third-party modules
 from dcc_mcp_core import error_result
+import rpyc
 
 # Import local modules
 from dcc_mcp_ipc.client.base import BaseApplicationClient
@@ -105,6 +107,61 @@ class BaseDCCClient(BaseApplicationClient):
         with self.ensure_connection() as connection:
             return func(connection)
 
+    def call_async(self, method_name: str, *args: Any, **kwargs: Any) -> rpyc.AsyncResult:
+        """Send a remote call without waiting for its reply.
+
+        The caller can do other work, or issue further calls, while the request is in flight and wait
+        on the returned handle later. Use ``batch`` to pipeline several calls behind a single
+        connection check.
+
+        Args:
+            method_name: Name of the method on the service root
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            An AsyncResult whose ``value`` blocks until the reply arrives and re-raises remote errors
+
+        Raises:
+            ConnectionError: If the client cannot connect
+
+        """
+        return self.execute_with_connection(lambda conn: rpyc.async_(getattr(conn.root, method_name))(*args, **kwargs))
+
+    def batch(self, calls: list[tuple[str, tuple, Optional[dict[str, Any]]]]) -> list[Any]:
+        """Execute several remote calls pipelined over the connection.
+
+        Every request is sent asynchronously before any reply is awaited, so the calls overlap on the
+        connection instead of each waiting for the previous reply. There is still one request and one
+        reply per call.
+
+        The calls are independent: if one fails, its error is raised once that result is collected and
+        the remaining replies are discarded. Calls sent before or after it may already have run on the
+        server, so a batch is not atomic.
+
+        Args:
+            calls: ``(method_name, args, kwargs)`` tuples naming methods on the service root;
+                ``kwargs`` may be None
+
+        Returns:
+            Results in the same order as ``calls``
+
+        Raises:
+            ConnectionError: If the client cannot connect
+            Exception: If any of the remote calls fails
+
+        """
+
+        # Check the connection once; call_async would ping the server before every request
+        def _batch(conn: rpyc.Connection) -> list[Any]:
+            pending = [
+                rpyc.async_(getattr(conn.root, method_name))(*args, **(kwargs or {}))
+                for method_name, args, kwargs in calls
+            ]
+            return [result.value for result in pending]
+
+        return self.execute_with_connection(_batch)
+
     def get_dcc_info(self) -> dict[str, Any]:
         """Get information about the DCC application.
 
@@ -4,15 +4,36 @@ This module provides a service discovery strategy that uses files to register an
 """
 
 # Import built-in modules
+from collections.abc import Iterator
+from contextlib import contextmanager
+import copy
 import json
 import logging
 import os
+import sys
+import threading
 import time
+from typing import Any
 from typing import Optional
 
 # Import third-party modules
 from dcc_mcp_core import get_config_dir
 
+if sys.platform == "win32":
+    # Import built-in modules
+    import msvcrt
+else:
+    # Import built-in modules
+    import fcntl
+
+try:
+    # Import third-party modules
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import local modules
 from dcc_mcp_ipc.discovery.base import ServiceDiscoveryStrategy
 from dcc_mcp_ipc.discovery.base import ServiceInfo
@@ -40,6 +61,118 @@ def _get_default_config_dir() -> str:
 
 DEFAULT_REGISTRY_PATH = os.path.join(_get_default_config_dir(), "service_registry.json")
 
+# Services whose registration is older than this many seconds are treated as stale
+SERVICE_STALE_SECONDS = 3600
+
+# Parsed registry files keyed by absolute path, each stored with the stat signature of the file it was read
+# from or written to. An entry is only reused while the file's signature matches exactly
+_REGISTRY_CACHE: dict[str, tuple[tuple[int, int, int, int], dict[str, Any]]] = {}
+_REGISTRY_CACHE_LOCK = threading.Lock()
+
+# Attempts made to swap in a saved registry while another process holds the file open, which Windows refuses
+REPLACE_ATTEMPTS = 5
+# Seconds to wait after the first refused swap, doubled after each further one
+REPLACE_RETRY_DELAY = 0.01
+
+
+def _stat_signature(stat_result: os.stat_result) -> tuple[int, int, int, int]:
+    """Return the cache signature of a registry file.
+
+    The inode and ctime are included alongside mtime and size, so a registry swapped in with ``os.replace``
+    is told apart from the file it replaced even when both have the same mtime and size.
+    """
+    return stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_ctime_ns, stat_result.st_size
+
+
+def _dumps_registry(services: dict[str, Any]) -> bytes:
+    """Serialize registry data to JSON bytes, using orjson when it is installed.
+
+    Args:
+        services: Registry data to serialize
+
+    Returns:
+        UTF-8 encoded JSON document
+
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(services, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(services, indent=2).encode("utf-8")
+
+
+def _loads_registry(raw: bytes) -> dict[str, Any]:
+    """Deserialize registry data from JSON bytes, using orjson when it is installed.
+
+    Args:
+        raw: UTF-8 encoded JSON document
+
+    Returns:
+        The decoded registry data
+
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _replace_registry_file(temp_path: str, registry_path: str) -> None:
+    """Swap a saved registry into place, retrying while the target file is held open.
+
+    On Windows ``os.replace`` raises PermissionError while any process, such as a reader that does not take
+    the registry lock, has the target open. Readers only hold it briefly, so the swap is retried with a short
+    backoff before giving up. Elsewhere a PermissionError is permanent and is raised straight away.
+
+    Args:
+        temp_path: Path of the fully written temporary registry file
+        registry_path: Path of the registry file to replace
+
+    """
+    attempts = REPLACE_ATTEMPTS if os.name == "nt" else 1
+    delay = REPLACE_RETRY_DELAY
+    for _ in range(attempts - 1):
+        try:
+            os.replace(temp_path, registry_path)
+            return
+        except PermissionError:
+            time.sleep(delay)
+            delay *= 2
+    os.replace(temp_path, registry_path)
+
+
+@contextmanager
+def _registry_file_lock(registry_path: str) -> Iterator[None]:
+    """Hold an exclusive inter-process lock for a registry read-modify-write cycle.
+
+    The lock is taken on a ``.lock`` sidecar file so the registry itself can still be swapped
+    with ``os.replace`` while the lock is held.
+    The sidecar is left in place afterwards: removing it while another process waits on it would
+    let two writers lock different files.
+
+    Args:
+        registry_path: Path to the registry file to lock
+
+    """
+    directory = os.path.dirname(registry_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    fd = os.open(f"{registry_path}.lock", os.O_CREAT | os.O_RDWR, 0o666)
+    try:
+        if sys.platform == "win32":
+            # LK_LOCK retries for about 10 seconds before raising OSError
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
 
 class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
     """File-based service discovery strategy.
@@ -47,41 +180,106 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
     This strategy uses files to register and discover services.
     """
 
-    def __init__(self, registry_path: Optional[str] = None):
+    def __init__(self, registry_path: Optional[str] = None, register_throttle: float = 0.0):
         """Initialize the file discovery strategy.
 
         Args:
             registry_path: Path to the registry file (default: None, uses default path)
+            register_throttle: Seconds during which re-registering an unchanged service skips the
+                registry write, for heartbeat-style callers (default: 0.0, always write)
 
         """
         self.registry_path = registry_path or DEFAULT_REGISTRY_PATH
+        self.register_throttle = register_throttle
         self._services = {}
+        # Stat signature of the registry file that self._services currently mirrors
+        self._loaded_signature: Optional[tuple[int, int, int, int]] = None
         self._load_registry()
 
     def _load_registry(self) -> None:
-        """Load the registry from file."""
+        """Load the registry from file.
+
+        Parsed registries are cached per process and reused while the file's stat signature is unchanged.
+        The cache only holds data parsed from the file, the strategy only ever replaces its entries, and
+        discover_services deep-copies what it hands out, so a shallow copy is enough to keep the cached
+        registry isolated from this instance.
+        """
         try:
-            if os.path.exists(self.registry_path):
-                with open(self.registry_path) as f:
-                    data = json.load(f)
-                    self._services = data
-                    logger.debug(f"Loaded registry from {self.registry_path}")
-            else:
-                logger.debug(f"Registry file {self.registry_path} does not exist")
+            # A single stat both checks existence and provides the cache signature
+            signature = _stat_signature(os.stat(self.registry_path))
+            if signature == self._loaded_signature:
+                return
+
+            cache_path = os.path.abspath(self.registry_path)
+            with _REGISTRY_CACHE_LOCK:
+                cached = _REGISTRY_CACHE.get(cache_path)
+            if cached is not None and cached[0] == signature:
+                self._services = dict(cached[1])
+                self._loaded_signature = signature
+                logger.debug(f"Loaded registry from cache for {self.registry_path}")
+                return
+
+            with open(self.registry_path, "rb") as f:
+                # Key the cache on the file actually read, in case it was replaced after the stat
+                signature = _stat_signature(os.fstat(f.fileno()))
+                data = _loads_registry(f.read())
+            with _REGISTRY_CACHE_LOCK:
+                _REGISTRY_CACHE[cache_path] = (signature, data)
+            self._services = dict(data)
+            self._loaded_signature = signature
+            logger.debug(f"Loaded registry from {self.registry_path}")
+        except FileNotFoundError:
+            logger.debug(f"Registry file {self.registry_path} does not exist")
         except Exception as e:
             logger.error(f"Error loading registry: {e}")
 
     def _save_registry(self) -> None:
-        """Save the registry to file."""
+        """Save the registry to file.
+
+        The registry is written to a temporary file in a single write, flushed to disk and then
+        swapped in with ``os.replace`` so readers never observe a partially written registry.
+
+        Raises:
+            OSError: If the registry could not be written or swapped into place
+
+        """
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
 
-            with open(self.registry_path, "w") as f:
-                json.dump(self._services, f, indent=2)
-                logger.debug(f"Saved registry to {self.registry_path}")
-        except Exception as e:
-            logger.error(f"Error saving registry: {e}")
+            data = _dumps_registry(self._services)
+            temp_path = f"{self.registry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+            try:
+                try:
+                    # A regular file accepts the whole buffer in one write; loop only for short writes
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                _replace_registry_file(temp_path, self.registry_path)
+            except Exception:
+                try:
+                    os.remove(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+
+            # Seed the cache with the bytes just written, parsed back so it holds exactly what the file does
+            # rather than objects still shared with callers, such as their metadata dicts
+            signature = _stat_signature(os.stat(self.registry_path))
+            saved = _loads_registry(data)
+            with _REGISTRY_CACHE_LOCK:
+                _REGISTRY_CACHE[os.path.abspath(self.registry_path)] = (signature, saved)
+            self._services = dict(saved)
+            self._loaded_signature = signature
+            logger.debug(f"Saved registry to {self.registry_path}")
+        except Exception:
+            # The in-memory registry no longer mirrors the file; force the next load to re-read it
+            self._loaded_signature = None
+            raise
 
     def discover_services(self, service_type: Optional[str] = None) -> list[ServiceInfo]:
         """Discover available services.
@@ -96,6 +294,9 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
         # Reload the registry to get the latest services
         self._load_registry()
 
+        # Take a single clock snapshot; anything registered before the cutoff is stale
+        cutoff = time.time() - SERVICE_STALE_SECONDS
+
         services = []
         for key, service_data in self._services.items():
             # Check if service data is valid
@@ -106,14 +307,15 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
             # Extract dcc_type from service data or key
             # New format: stored in service_data["dcc_type"]
             # Legacy format: key is the dcc_type directly (no ":" separator)
-            dcc_type = service_data.get("dcc_type", key.split(":")[0] if ":" in key else key)
+            dcc_type = service_data.get("dcc_type")
+            if dcc_type is None:
+                dcc_type = key.split(":", 1)[0]
 
             if service_type and dcc_type != service_type:
                 continue
 
-            # Check if service is stale (older than 1 hour)
-            timestamp = service_data.get("timestamp", 0)
-            if time.time() - timestamp > 3600:  # 1 hour
+            # Check if service is stale (older than SERVICE_STALE_SECONDS)
+            if service_data.get("timestamp", 0) < cutoff:
                 logger.debug(f"Service {key} is stale, skipping")
                 continue
 
@@ -123,7 +325,8 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
                     host=service_data.get("host", ""),
                     port=service_data.get("port", 0),
                     dcc_type=dcc_type,
-                    metadata=service_data.get("metadata", {}),
+                    # Deep-copied so callers cannot mutate the process-wide registry cache through it
+                    metadata=copy.deepcopy(service_data.get("metadata", {})),
                 )
                 services.append(service_info)
             except Exception as e:
@@ -147,6 +350,44 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
         """
         return f"{service_info.dcc_type}:{service_info.host}:{service_info.port}"
 
+    @staticmethod
+    def _make_service_data(service_info: ServiceInfo, timestamp: float) -> dict[str, Any]:
+        """Create the registry entry for a service.
+
+        Args:
+            service_info: Information about the service
+            timestamp: Registration time to record for the entry
+
+        Returns:
+            The registry entry to store under the service key
+
+        """
+        return {
+            "name": service_info.name,
+            "host": service_info.host,
+            "port": service_info.port,
+            "dcc_type": service_info.dcc_type,
+            "timestamp": timestamp,
+            "metadata": service_info.metadata,
+        }
+
+    def _is_recent_duplicate(self, existing: Any, service_data: dict[str, Any]) -> bool:
+        """Check whether a registration only refreshes a recent, otherwise identical entry.
+
+        Args:
+            existing: The registry entry currently stored under the service key, if any
+            service_data: The entry about to be written
+
+        Returns:
+            True if the write can be skipped under ``register_throttle``, False otherwise
+
+        """
+        if self.register_throttle <= 0 or not isinstance(existing, dict):
+            return False
+        if service_data["timestamp"] - existing.get("timestamp", 0) >= self.register_throttle:
+            return False
+        return all(existing.get(field) == value for field, value in service_data.items() if field != "timestamp")
+
     def register_service(self, service_info: ServiceInfo) -> bool:
         """Register a service with the discovery mechanism.
 
@@ -158,26 +399,24 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
 
         """
         try:
-            # Reload the registry to get the latest services
-            self._load_registry()
-
-            # Create service data
-            service_data = {
-                "name": service_info.name,
-                "host": service_info.host,
-                "port": service_info.port,
-                "dcc_type": service_info.dcc_type,
-                "timestamp": time.time(),
-                "metadata": service_info.metadata,
-            }
-
-            # Register the service using composite key (dcc_type:host:port)
-            # This allows multiple instances of the same DCC type
-            key = self._make_service_key(service_info)
-            self._services[key] = service_data
-
-            # Save the registry
-            self._save_registry()
+            # Hold the registry lock so concurrent writers cannot drop each other's updates
+            with _registry_file_lock(self.registry_path):
+                # Reload the registry to get the latest services
+                self._load_registry()
+
+                # Create service data
+                service_data = self._make_service_data(service_info, time.time())
+
+                # Register the service using composite key (dcc_type:host:port)
+                # This allows multiple instances of the same DCC type
+                key = self._make_service_key(service_info)
+                if self._is_recent_duplicate(self._services.get(key), service_data):
+                    logger.debug(f"Service {key} was registered recently with the same data, skipping write")
+                    return True
+                self._services[key] = service_data
+
+                # Save the registry
+                self._save_registry()
 
             logger.info(
                 f"Registered service {service_info.name} for DCC "
@@ -188,6 +427,48 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
             logger.error(f"Error registering service: {e}")
             return False
 
+    def register_services(self, service_infos: list[ServiceInfo]) -> bool:
+        """Register several services with a single registry write.
+
+        The registry is locked, loaded and saved once for the whole batch rather than once per service.
+
+        Args:
+            service_infos: Information about the services to register
+
+        Returns:
+            True if registration was successful, False otherwise
+
+        """
+        try:
+            # Hold the registry lock so concurrent writers cannot drop each other's updates
+            with _registry_file_lock(self.registry_path):
+                # Reload the registry to get the latest services
+                self._load_registry()
+
+                timestamp = time.time()
+                written = 0
+                for service_info in service_infos:
+                    service_data = self._make_service_data(service_info, timestamp)
+                    key = self._make_service_key(service_info)
+                    if self._is_recent_duplicate(self._services.get(key), service_data):
+                        logger.debug(f"Service {key} was registered recently with the same data, skipping")
+                        continue
+                    self._services[key] = service_data
+                    written += 1
+
+                # Save the registry only if any entry changed
+                if written:
+                    self._save_registry()
+
+            logger.info(
+                f"Registered {written} services in {self.registry_path}, "
+                f"skipped {len(service_infos) - written} unchanged"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error registering services: {e}")
+            return False
+
     def unregister_service(self, service_info: ServiceInfo) -> bool:
         """Unregister a service from the discovery mechanism.
 
@@ -199,26 +480,28 @@ class FileDiscoveryStrategy(ServiceDiscoveryStrategy):
 
         """
         try:
-            # Reload the registry to get the latest services
-            self._load_registry()
-
-            key = self._make_service_key(service_info)
-
-            # Try new composite key first
-            if key in self._services:
-                del self._services[key]
-            # Fallback: try legacy dcc_type key for backward compatibility
-            elif service_info.dcc_type in self._services:
-                del self._services[service_info.dcc_type]
-            else:
-                logger.warning(
-                    f"Service {service_info.name} for DCC "
-                    f"{service_info.dcc_type} at {service_info.host}:{service_info.port} not found"
-                )
-                return False
-
-            # Save the registry
-            self._save_registry()
+            # Hold the registry lock so concurrent writers cannot drop each other's updates
+            with _registry_file_lock(self.registry_path):
+                # Reload the registry to get the latest services
+                self._load_registry()
+
+                key = self._make_service_key(service_info)
+
+                # Try new composite key first
+                if key in self._services:
+                    del self._services[key]
+                # Fallback: try legacy dcc_type key for backward compatibility
+                elif service_info.dcc_type in self._services:
+                    del self._services[service_info.dcc_type]
+                else:
+                    logger.warning(
+                        f"Service {service_info.name} for DCC "
+                        f"{service_info.dcc_type} at {service_info.host}:{service_info.port} not found"
+                    )
+                    return False
+
+                # Save the registry
+                self._save_registry()
 
             logger.info(
                 f"Unregistered service {service_info.name} for DCC "
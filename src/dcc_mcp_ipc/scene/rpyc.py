@@ -392,10 +392,10 @@ class RPyCSceneInfo(BaseSceneInfo):
         if func is None and self._connection is not None:
             root = getattr(self._connection, "root", None)
             if root is not None:
-                if hasattr(root, "exposed_execute_python"):
-                    func = root.exposed_execute_python
-                elif hasattr(root, "execute_python"):
-                    func = root.execute_python
+                # Each attribute lookup on a netref is a round trip, so fetch once instead of hasattr + getattr
+                func = getattr(root, "exposed_execute_python", None)
+                if func is None:
+                    func = getattr(root, "execute_python", None)
         if func is None:
             raise SceneError(
                 "No execute function provided and no valid connection available",
@@ -533,26 +533,66 @@ class RPyCSceneInfo(BaseSceneInfo):
         return []
 
     def _get_scene_metadata(self) -> dict[str, Any]:
-        """Get DCC-specific metadata."""
-        meta = {}
-        try:
-            if self._dcc_name == "maya":
-                start = self._exec(
-                    "import maya.cmds as cmds; "
-                    "cmds.playbackOptions(q=True, minTime=True), "
-                    "cmds.playbackOptions(q=True, maxTime=True)"
+        """Get DCC-specific metadata.
+
+        The fields are fetched in a single remote call. If that call fails or its result is malformed,
+        each field is queried on its own so one failing query does not drop the others.
+        """
+        meta: dict[str, Any] = {}
+        if self._dcc_name == "maya":
+            values = self._exec_metadata(
+                "import maya.cmds as cmds",
+                {
+                    "frame_range": "(cmds.playbackOptions(q=True, minTime=True), "
+                    "cmds.playbackOptions(q=True, maxTime=True))",
+                    "current_frame": "cmds.currentTime(q=True)",
+                    "units": "cmds.currentUnit(q=True, linear=True)",
+                },
+            )
+            if "frame_range" in values:
+                frame_range = values.pop("frame_range")
+                meta["frame_range"] = list(frame_range) if hasattr(frame_range, "__iter__") else (1, 120)
+            meta.update(values)
+        elif self._dcc_name == "blender":
+            meta.update(
+                self._exec_metadata(
+                    "import bpy",
+                    {
+                        "frame_start": "bpy.context.scene.frame_start",
+                        "frame_end": "bpy.context.scene.frame_end",
+                        "current_frame": "bpy.context.scene.frame_current",
+                    },
                 )
-                meta["frame_range"] = list(start) if hasattr(start, "__iter__") else (1, 120)
-                meta["current_frame"] = self._exec("import maya.cmds as cmds; cmds.currentTime(q=True)")
-                meta["units"] = self._exec("import maya.cmds as cmds; cmds.currentUnit(q=True, linear=True)")
-            elif self._dcc_name == "blender":
-                meta["frame_start"] = self._exec("import bpy; bpy.context.scene.frame_start")
-                meta["frame_end"] = self._exec("import bpy; bpy.context.scene.frame_end")
-                meta["current_frame"] = self._exec("import bpy; bpy.context.scene.frame_current")
-        except (SceneError, AttributeError):
-            pass
+            )
         return meta
 
+    def _exec_metadata(self, prelude: str, fields: dict[str, str]) -> dict[str, Any]:
+        """Evaluate metadata expressions remotely, keyed by field name.
+
+        Args:
+            prelude: Import statement run before the expressions.
+            fields: Mapping of field name to the expression that produces it.
+
+        Returns:
+            The values that could be fetched; a field whose query fails is left out.
+
+        """
+        try:
+            values = self._exec(f"{prelude}; " + ", ".join(fields.values()))
+            if isinstance(values, (list, tuple)) and len(values) == len(fields):
+                return dict(zip(fields, values))
+            logger.debug("Combined metadata query returned %r, querying fields one by one", values)
+        except (SceneError, AttributeError):
+            logger.debug("Combined metadata query failed, querying fields one by one")
+
+        result: dict[str, Any] = {}
+        for name, expression in fields.items():
+            try:
+                result[name] = self._exec(f"{prelude}; {expression}")
+            except (SceneError, AttributeError):
+                logger.debug(f"Metadata query for {name} failed")
+        return result
+
     # ---- Internal helpers --------------------------------------------------
 
     @staticmethod
@@ -7,7 +7,6 @@ This module provides DCC-specific RPYC services and server implementation.
 from abc import abstractmethod
 import logging
 import threading
-import time
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -24,7 +23,9 @@ from dcc_mcp_ipc.server.base import ApplicationRPyCService
 from dcc_mcp_ipc.server.decorators import with_scene_info
 from dcc_mcp_ipc.server.discovery import register_dcc_service
 from dcc_mcp_ipc.server.discovery import unregister_dcc_service
+from dcc_mcp_ipc.server.server_utils import SERVER_START_TIMEOUT
 from dcc_mcp_ipc.server.server_utils import create_raw_threaded_server
+from dcc_mcp_ipc.server.server_utils import poll_for
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -154,12 +155,13 @@ class DCCServer:
             port=self.port,
         )
 
-    def start(self, threaded: bool = True) -> Union[int, bool]:
+    def start(self, threaded: bool = True, ready: Optional[threading.Event] = None) -> Union[int, bool]:
         """Start the RPYC server.
 
         Args:
         ----
             threaded: Whether to run the server in a separate thread (default: True)
+            ready: Optional event that is set once a threaded server is listening and registered
 
         Returns:
         -------
@@ -178,7 +180,7 @@ class DCCServer:
 
                 # Start the server in a thread if requested
                 if threaded:
-                    return self._start_in_thread()
+                    return self._start_in_thread(ready)
 
                 # Start the server in the current thread
                 logger.info("Starting server on %s:%s", self.host, self.port)
@@ -188,26 +190,48 @@ class DCCServer:
                 logger.exception("Failed to start server: %s", e)
                 return False
 
-    def _start_in_thread(self) -> Union[int, bool]:
+    def _start_in_thread(self, ready: Optional[threading.Event] = None) -> Union[int, bool]:
         """Start the RPYC server in a thread.
 
         This is a convenience wrapper around start(threaded=True).
 
-        Returns
+        Args:
+        ----
+            ready: Optional event that is set once the server is listening and registered
+
+        Returns:
         -------
             The port the server is running on, or False if the server failed to start
 
         """
         try:
-            # Create a thread to run the server
-            thread = threading.Thread(target=self.server.start, daemon=True)
+            server = self.server
+            if server is None:
+                raise RuntimeError(f"RPYC server for {self.dcc_name} has not been created")
+            start_errors: list[Exception] = []
+
+            def _serve() -> None:
+                # Keep the failure for the caller instead of letting it escape as an unhandled thread exception
+                try:
+                    server.start()
+                except Exception as e:
+                    logger.error(f"RPYC server for {self.dcc_name} stopped with an error: {e}")
+                    start_errors.append(e)
+
+            # Create a thread to run the server and wait until it is listening or has given up. rpyc only
+            # exposes readiness through the public active flag, so it is polled as lifecycle.start_server does
+            thread = threading.Thread(target=_serve, daemon=True)
             thread.start()
-
-            # Wait for the server to start
-            time.sleep(0.1)
+            poll_for(lambda: server.active or not thread.is_alive(), timeout=SERVER_START_TIMEOUT)
+            if start_errors:
+                raise start_errors[0]
+            if not server.active:
+                raise RuntimeError(
+                    f"RPYC server for {self.dcc_name} did not start listening within {SERVER_START_TIMEOUT} seconds"
+                )
 
             # Get the port the server is running on
-            self.port = self.server.port
+            self.port = server.port
 
             # Register the service using both methods for backward compatibility
             # 1. File-based registration
@@ -235,11 +259,14 @@ class DCCServer:
 
             self.running = True
             logger.info(f"Started RPYC server for {self.dcc_name} on {self.host}:{self.port}")
+            if ready is not None:
+                ready.set()
             return self.port
         except Exception as e:
             logger.error(f"Error starting RPYC server for {self.dcc_name}: {e}")
             logger.exception("Detailed exception information:")
-            self.server = None
+            # The server is already bound and may still start listening, so close it rather than just dropping it
+            self.close()
             return False
 
     def stop(self) -> bool:
@@ -298,7 +325,7 @@ class DCCServer:
         """
         return self.stop()
 
-    def close(self):
+    def close(self) -> None:
         """Close the RPYC server.
 
         This method is used to close the server and release any system resources.
@@ -21,7 +21,9 @@ from dcc_mcp_ipc.server.dcc import DCCServer
 from dcc_mcp_ipc.server.factory import cleanup_server
 from dcc_mcp_ipc.server.factory import create_dcc_server as _create_dcc_server
 from dcc_mcp_ipc.server.factory import create_raw_threaded_server
+from dcc_mcp_ipc.server.server_utils import SERVER_START_TIMEOUT
 from dcc_mcp_ipc.server.server_utils import get_rpyc_config
+from dcc_mcp_ipc.server.server_utils import poll_for
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -97,7 +99,7 @@ def start_server(
     """Start a server in a new thread.
 
     This function starts a server in a new thread and optionally registers it
-    for discovery.
+    for discovery. It returns once the server is listening for connections.
 
     Args:
     ----
@@ -112,12 +114,16 @@ def start_server(
     Raises:
     ------
         ValueError: If the server is already running
+        RuntimeError: If the server failed to start or is not listening within SERVER_START_TIMEOUT seconds
+        Exception: Any error raised by the server while it was starting
 
     """
     # Find the server in the registry
+    server_id = None
     server_info = None
     for sid, info in _servers.items():
         if info["server"] is server:
+            server_id = sid
             server_info = info
             break
 
@@ -137,19 +143,48 @@ def start_server(
     if server_info["running"]:
         raise ValueError("Server is already running")
 
+    start_errors: list[Exception] = []
+    start_results: list[Any] = []
+
     # Define the thread target function
     def _server_thread():
         try:
             logger.info(f"Starting server on {server.host}:{server.port}")
-            server.start()
+            # DCCServer.start() reports a bind or start failure by returning False rather than raising
+            start_results.append(server.start())
         except Exception as e:
             logger.error(f"Error in server thread: {e}")
             server_info["running"] = False
+            start_errors.append(e)
 
     # Create and start the thread
     thread = threading.Thread(target=_server_thread, daemon=daemon)
     thread.start()
 
+    def _is_listening() -> bool:
+        # A DCCServer's start() returns once it is ready, ending the thread, and leaves it marked as running
+        if isinstance(server, DCCServer):
+            return server.is_running()
+        return bool(server.active)
+
+    # Wait until the server is listening or its thread has exited, then check which one happened.
+    # A TCP probe is deliberately avoided: each probe would be accepted and served as a real RPyC client.
+    poll_for(lambda: _is_listening() or not thread.is_alive(), timeout=SERVER_START_TIMEOUT)
+    if not _is_listening():
+        # The server is already bound and may still start listening, so close it and forget it
+        try:
+            server.close()
+        except Exception as e:
+            logger.error(f"Error closing server on {server.host}:{server.port}: {e}")
+        _servers.pop(server_id, None)
+        if start_errors:
+            raise start_errors[0]
+        if start_results and start_results[0] is False:
+            raise RuntimeError(f"Server on {server.host}:{server.port} failed to start")
+        raise RuntimeError(
+            f"Server on {server.host}:{server.port} did not start listening within {SERVER_START_TIMEOUT} seconds"
+        )
+
     # Update the server info
     server_info["thread"] = thread
     server_info["running"] = True
@@ -6,6 +6,7 @@ for DCC applications.
 
 # Import built-in modules
 import logging
+import time
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -17,6 +18,9 @@ from rpyc.utils.server import ThreadedServer
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a server started in a background thread to begin listening
+SERVER_START_TIMEOUT = 5.0
+
 
 def get_rpyc_config(allow_all_attrs=False, allow_public_attrs=True, allow_pickle=False) -> dict[str, Any]:
     """Get a configuration dictionary for RPyC connections.
@@ -47,6 +51,28 @@ def get_rpyc_config(allow_all_attrs=False, allow_public_attrs=True, allow_pickle
     return config
 
 
+def poll_for(predicate: Callable[[], Any], timeout: float = 5.0, interval: float = 0.005) -> bool:
+    """Wait until a predicate becomes true instead of sleeping for a fixed time.
+
+    The deadline is measured on the monotonic clock so wall-clock adjustments cannot cut the wait short or extend it.
+
+    Args:
+        predicate: Callable checked repeatedly until it returns a truthy value
+        timeout: Maximum number of seconds to wait
+        interval: Number of seconds to sleep between checks
+
+    Returns:
+        True if the predicate became true before the timeout, False otherwise
+
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return bool(predicate())
+
+
 def create_raw_threaded_server(
     service_class: type[service.Service],
     hostname: str = "localhost",
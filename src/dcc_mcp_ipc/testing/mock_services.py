@@ -21,10 +21,39 @@ from rpyc.utils.server import ThreadedServer
 from dcc_mcp_ipc.discovery import ServiceInfo
 from dcc_mcp_ipc.discovery import ServiceRegistry
 from dcc_mcp_ipc.server import DCCRPyCService
+from dcc_mcp_ipc.server.server_utils import SERVER_START_TIMEOUT
+from dcc_mcp_ipc.server.server_utils import poll_for
 
 # Dictionary to store mock servers for cleanup
 _mock_servers = {}
 
+# Invariant parts of the mock responses, built once at import time.
+# Treat these as read-only: they are shared by every call.
+_MOCK_DCC_INFO = {
+    "version": "1.0.0",
+    "platform": sys.platform,
+    "python_version": sys.version,
+}
+
+_MOCK_ACTIONS = {
+    "create_primitive": {
+        "name": "create_primitive",
+        "description": "Create a primitive object",
+        "parameters": {
+            "primitive_type": {
+                "type": "string",
+                "description": "Type of primitive to create",
+                "required": True,
+            },
+        },
+    },
+    "get_scene_info": {
+        "name": "get_scene_info",
+        "description": "Get information about the current scene",
+        "parameters": {},
+    },
+}
+
 
 class MockDCCService(DCCRPyCService):
     """Mock DCC RPYC service for testing.
@@ -421,29 +450,11 @@ class MockDCCService(DCCRPyCService):
 
         Returns
         -------
-            Dict with action information
+            Dict with action information. The "actions" value is the shared module-level catalogue and
+            must be treated as read-only.
 
         """
-        return {
-            "actions": {
-                "create_primitive": {
-                    "name": "create_primitive",
-                    "description": "Create a primitive object",
-                    "parameters": {
-                        "primitive_type": {
-                            "type": "string",
-                            "description": "Type of primitive to create",
-                            "required": True,
-                        },
-                    },
-                },
-                "get_scene_info": {
-                    "name": "get_scene_info",
-                    "description": "Get information about the current scene",
-                    "parameters": {},
-                },
-            }
-        }
+        return {"actions": _MOCK_ACTIONS}
 
     def exposed_call_action(self, action_name: str, *args, **kwargs) -> dict[str, Any]:
         """Call an action by name.
@@ -459,20 +470,14 @@ class MockDCCService(DCCRPyCService):
             Result of the action in ActionResultModel format
 
         """
-        # Map action names to methods
-        action_map = {
-            "create_primitive": self.create_primitive,
-            "get_scene_info": self.get_scene_info,
-        }
-
-        # Get the action function
-        action_func = action_map.get(action_name)
-        if action_func is None:
+        # The action catalogue doubles as the dispatch table; actions map to methods of the same name
+        if action_name not in _MOCK_ACTIONS:
             return ActionResultModel(
                 success=False,
                 message=f"Unknown action: {action_name}",
                 error=f"Action {action_name} not found",
             ).to_dict()
+        action_func = getattr(self, action_name)
 
         # Call the action function
         try:
@@ -536,16 +541,10 @@ class MockDCCService(DCCRPyCService):
             Result of the command
 
         """
-        # Map command names to methods
-        cmd_map = {
-            "create_primitive": self.create_primitive,
-            "get_scene_info": self.get_scene_info,
-        }
-
-        # Get the command function
-        cmd_func = cmd_map.get(cmd_name)
-        if cmd_func is None:
+        # Commands share the action catalogue as their dispatch table
+        if cmd_name not in _MOCK_ACTIONS:
             raise ValueError(f"Unknown command: {cmd_name}")
+        cmd_func = getattr(self, cmd_name)
 
         # Call the command function
         return cmd_func(*args, **kwargs)
@@ -558,12 +557,7 @@ class MockDCCService(DCCRPyCService):
             Dict with DCC information including name, version, etc.
 
         """
-        return {
-            "name": self.dcc_name,
-            "version": "1.0.0",
-            "platform": sys.platform,
-            "python_version": sys.version,
-        }
+        return {"name": self.dcc_name, **_MOCK_DCC_INFO}
 
 
 def start_mock_dcc_service(dcc_name="mock_dcc", host="localhost", port=0):
@@ -580,6 +574,9 @@ def start_mock_dcc_service(dcc_name="mock_dcc", host="localhost", port=0):
     Returns:
         Tuple of (host, port) where the service is running
 
+    Raises:
+        RuntimeError: If the server is not listening within SERVER_START_TIMEOUT seconds
+
     Example:
         >>> from dcc_mcp_ipc.testing.mock_services import start_mock_dcc_service
         >>> host, port = start_mock_dcc_service("maya")
@@ -616,16 +613,17 @@ def start_mock_dcc_service(dcc_name="mock_dcc", host="localhost", port=0):
     # Store server instance for later closing
     _mock_servers[dcc_name] = (server, thread, host, port)
 
-    # Wait for server to start
-    # Import built-in modules
-    import time
-
-    time.sleep(0.5)
+    # Wait until the server is listening; a server that never starts is stopped rather than handed out
+    if not poll_for(lambda: server.active, timeout=SERVER_START_TIMEOUT):
+        stop_mock_dcc_service(dcc_name)
+        raise RuntimeError(
+            f"Mock {dcc_name} service did not start listening on {host}:{port} within {SERVER_START_TIMEOUT} seconds"
+        )
 
     return host, port
 
 
-def stop_mock_dcc_service(dcc_name):
+def stop_mock_dcc_service(dcc_name: str) -> None:
     """Stop a mock DCC service.
 
     This function stops a previously started mock DCC service.
@@ -8,6 +8,7 @@ transport for DCC applications that embed a Python interpreter
 
 # Import built-in modules
 import dataclasses
+from functools import partial
 import logging
 from typing import Any
 from typing import Optional
@@ -21,6 +22,7 @@ from dcc_mcp_ipc.transport.base import ConnectionError
 from dcc_mcp_ipc.transport.base import ProtocolError
 from dcc_mcp_ipc.transport.base import TransportConfig
 from dcc_mcp_ipc.transport.base import TransportState
+from dcc_mcp_ipc.utils.rpyc_utils import connect_nodelay
 
 logger = logging.getLogger(__name__)
 
@@ -33,18 +35,20 @@ class RPyCTransportConfig(TransportConfig):
         sync_request_timeout: RPyC sync request timeout in seconds.
         allow_all_attrs: Whether to allow access to all object attributes.
         allow_public_attrs: Whether to allow access to public attributes.
+        keepalive: Whether to enable TCP keep-alive so dead peers are detected promptly.
 
     """
 
     sync_request_timeout: float = 30.0
     allow_all_attrs: bool = True
     allow_public_attrs: bool = True
+    keepalive: bool = True
 
 
 class RPyCTransport(BaseTransport):
     """Transport implementation using RPyC (Remote Python Call).
 
-    This transport wraps ``rpyc.connect`` and provides a uniform interface
+    This transport wraps ``rpyc.connect`` (with ``TCP_NODELAY`` set) and provides a uniform interface
     for executing remote actions, Python code, and function calls within
     DCC applications that embed a Python interpreter.
     """
@@ -58,7 +62,7 @@ class RPyCTransport(BaseTransport):
         """
         super().__init__(config or RPyCTransportConfig())
         self._connection: Optional[rpyc.Connection] = None
-        self._connect_func = rpyc.connect
+        self._connect_func = partial(connect_nodelay, keepalive=self.rpyc_config.keepalive)
 
     @property
     def rpyc_config(self) -> RPyCTransportConfig:
@@ -27,6 +27,7 @@ from dcc_mcp_ipc.utils.errors import ConnectionError
 from dcc_mcp_ipc.utils.errors import DCCMCPError
 from dcc_mcp_ipc.utils.errors import ExecutionError
 from dcc_mcp_ipc.utils.errors import handle_error
+from dcc_mcp_ipc.utils.rpyc_utils import connect_nodelay
 from dcc_mcp_ipc.utils.rpyc_utils import deliver_parameters
 from dcc_mcp_ipc.utils.rpyc_utils import execute_remote_command
 
@@ -42,6 +43,7 @@ __all__ = [
     "ServiceInfo",
     "ServiceRegistry",
     "ZeroConfDiscoveryStrategy",
+    "connect_nodelay",
     "deliver_parameters",
     "execute_remote_command",
     "get_container",
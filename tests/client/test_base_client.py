@@ -103,6 +103,19 @@ def test_base_client_connect():
     mock_connect_func.assert_called_once_with("localhost", 8000, config={"sync_request_timeout": 5.0})
 
 
+def test_base_client_connect_default_enables_keepalive():
+    """Test the default connect function enables TCP keep-alive."""
+    mock_connection = MagicMock()
+    mock_connection.ping.return_value = True
+
+    client = BaseApplicationClient("test_app", "localhost", 8000, auto_connect=False)
+    with patch("dcc_mcp_ipc.client.base.connect_nodelay", return_value=mock_connection) as mock_connect:
+        result = client.connect()
+
+    assert result is True
+    mock_connect.assert_called_once_with("localhost", 8000, config={"sync_request_timeout": 5.0}, keepalive=True)
+
+
 def test_base_client_connect_already_connected():
     """Test client connection when already connected."""
     # Create mock connection
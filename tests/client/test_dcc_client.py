@@ -273,3 +273,45 @@ class TestClose:
             client.close()
 
         mock_disconnect.assert_not_called()
+
+
+class TestBatch:
+    """Tests for BaseDCCClient.batch and call_async against a live mock DCC server."""
+
+    def test_batch_returns_results_in_order(self, dcc_client):
+        """Test batch pipelines the calls and returns their results in call order."""
+        results = dcc_client.batch(
+            [
+                ("exposed_add", (1, 2), None),
+                ("exposed_echo", ("hello",), {}),
+                ("exposed_get_dcc_info", (), None),
+            ]
+        )
+
+        assert results[0] == 3
+        assert results[1] == "hello"
+        assert results[2]["name"] == "test_dcc"
+
+    def test_batch_empty(self, dcc_client):
+        """Test an empty batch returns an empty list."""
+        assert dcc_client.batch([]) == []
+
+    def test_batch_propagates_remote_error(self, dcc_client):
+        """Test a failing call in the batch raises on the client."""
+        with pytest.raises(AttributeError):
+            dcc_client.batch([("exposed_add", (1, 2), None), ("no_such_method", (), None)])
+
+    def test_call_async_returns_pending_result(self, dcc_client):
+        """Test call_async returns a handle that resolves to the remote result."""
+        first = dcc_client.call_async("exposed_add", 2, 3)
+        second = dcc_client.call_async("exposed_echo", arg="hello")
+
+        assert first.value == 5
+        assert second.value == "hello"
+
+    def test_call_async_not_connected_raises(self):
+        """Test call_async raises ConnectionError when the client cannot connect."""
+        client = make_client(connected=False)
+        with patch.object(client, "connect", return_value=False):
+            with pytest.raises(ConnectionError):
+                client.call_async("exposed_add", 1, 2)
@@ -305,9 +305,10 @@ def test_connection_pool_get_client_with_client_class():
     mock_client = MagicMock(spec=BaseDCCClient)
     mock_client.is_connected.return_value = True
 
-    with patch.object(BaseDCCClient, "__init__", return_value=None):
-        BaseDCCClient.is_connected = lambda self: True  # type: ignore[attr-defined]
-
+    with (
+        patch.object(BaseDCCClient, "__init__", return_value=None),
+        patch.object(BaseDCCClient, "is_connected", return_value=True),
+    ):
         pool = ConnectionPool()
         pool.get_client(
             "test_dcc",
@@ -7,7 +7,6 @@ This module provides fixtures and configuration for pytest tests.
 import os
 import tempfile
 import threading
-import time
 
 # Import third-party modules
 # Import dcc_mcp_core modules
@@ -15,6 +14,7 @@ import pytest
 from rpyc.utils.server import ThreadedServer
 
 # Import local modules
+from dcc_mcp_ipc.client import BaseDCCClient
 from dcc_mcp_ipc.discovery import FileDiscoveryStrategy
 from dcc_mcp_ipc.discovery import ServiceInfo
 from dcc_mcp_ipc.discovery import ServiceRegistry
@@ -22,9 +22,18 @@ from dcc_mcp_ipc.discovery import ServiceRegistry
 # Import dcc_mcp_ipc modules
 from dcc_mcp_ipc.server.base import BaseRPyCService
 from dcc_mcp_ipc.server.dcc import DCCServer
+from dcc_mcp_ipc.server.server_utils import SERVER_START_TIMEOUT
+from dcc_mcp_ipc.server.server_utils import poll_for
 from dcc_mcp_ipc.testing.mock_services import MockDCCService
 
 
+def _wait_until_listening(server):
+    """Wait for a threaded RPYC server to start listening, closing it and failing the test if it never does."""
+    if not poll_for(lambda: server.active, timeout=SERVER_START_TIMEOUT):
+        server.close()
+        pytest.fail(f"RPYC server did not start listening on port {server.port} within {SERVER_START_TIMEOUT} seconds")
+
+
 @pytest.fixture
 def temp_registry_path():
     """Provide a temporary registry file path."""
@@ -34,11 +43,12 @@ def temp_registry_path():
 
     yield temp_path
 
-    # Clean up the temporary file
-    try:
-        os.unlink(temp_path)
-    except OSError:
-        pass
+    # Clean up the temporary file and the registry lock file next to it
+    for path in (temp_path, f"{temp_path}.lock"):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 
 @pytest.fixture
@@ -52,10 +62,12 @@ def service_registry(temp_registry_path):
     ServiceRegistry._reset_instance()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rpyc_server():
     """Create a RPYC server for testing.
 
+    The server is stateless, so a single instance is shared by every test in the session.
+
     Yields
     ------
         Tuple of (server, port)
@@ -69,8 +81,8 @@ def rpyc_server():
     server_thread = threading.Thread(target=server.start, daemon=True)
     server_thread.start()
 
-    # Wait for the server to start
-    time.sleep(0.1)
+    # Wait for the server to start listening and fail fast if it never does
+    _wait_until_listening(server)
 
     # Get the port that was assigned
     port = server.port
@@ -82,10 +94,12 @@ def rpyc_server():
     server_thread.join(timeout=1.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dcc_rpyc_server():
     """Create a DCC RPYC server for testing.
 
+    The server is stateless, so a single instance is shared by every test in the session.
+
     Yields
     ------
         Tuple of (server, port)
@@ -99,8 +113,8 @@ def dcc_rpyc_server():
     server_thread = threading.Thread(target=server.start, daemon=True)
     server_thread.start()
 
-    # Wait for the server to start
-    time.sleep(0.1)
+    # Wait for the server to start listening and fail fast if it never does
+    _wait_until_listening(server)
 
     # Get the port that was assigned
     port = server.port
@@ -112,6 +126,26 @@ def dcc_rpyc_server():
     server_thread.join(timeout=1.0)
 
 
+@pytest.fixture(scope="module")
+def dcc_client(dcc_rpyc_server):
+    """Provide a client connected to the shared DCC RPYC server.
+
+    The connection handshake is paid once per module. Tests must not close the client. The connection is
+    checked here because a test that patches is_connected could otherwise leave the shared client without
+    one, and the failure would surface in an unrelated test.
+
+    Yields
+    ------
+        Connected BaseDCCClient instance
+
+    """
+    _, port = dcc_rpyc_server
+    client = BaseDCCClient("maya", host="localhost", port=port)
+    assert client.connection is not None, f"dcc_client failed to connect to the DCC RPYC server on port {port}"
+    yield client
+    client.close()
+
+
 @pytest.fixture
 def dcc_server(temp_registry_path, service_registry):
     """Create a DCC server for testing.
@@ -134,8 +168,8 @@ def dcc_server(temp_registry_path, service_registry):
     server_thread = threading.Thread(target=server.start, daemon=True)
     server_thread.start()
 
-    # Wait for the server to start
-    time.sleep(0.1)
+    # Wait for the server to start listening and fail fast if it never does
+    _wait_until_listening(server)
 
     # Get the port that was assigned
     port = server.port
@@ -156,10 +190,12 @@ def dcc_server(temp_registry_path, service_registry):
     server_thread.join(timeout=1.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dcc_service():
     """Create a DCC service for testing.
 
+    The service keeps no per-call state, so a single instance is shared by every test in the session.
+
     Returns
     -------
         MockDCCService instance
@@ -0,0 +1,43 @@
+"""Pytest configuration for the discovery tests.
+
+This module resets discovery singletons and caches around every test and provides shared fixtures.
+"""
+
+# Import built-in modules
+import os
+import tempfile
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from dcc_mcp_ipc.discovery import file_strategy
+from dcc_mcp_ipc.discovery.factory import ServiceDiscoveryFactory
+from dcc_mcp_ipc.discovery.registry import ServiceRegistry
+
+
+@pytest.fixture(autouse=True)
+def _reset_discovery_state():
+    """Reset the discovery singletons and the registry file cache before and after each test."""
+    ServiceRegistry._reset_instance()
+    ServiceDiscoveryFactory._reset_instance()
+    file_strategy._REGISTRY_CACHE.clear()
+    yield
+    ServiceRegistry._reset_instance()
+    ServiceDiscoveryFactory._reset_instance()
+    file_strategy._REGISTRY_CACHE.clear()
+
+
+@pytest.fixture
+def temp_registry_file():
+    """Create a temporary registry file holding an empty registry."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
+        f.write(b"{}")
+        registry_path = f.name
+
+    yield registry_path
+
+    # Clean up the registry and its lock file
+    for path in (registry_path, f"{registry_path}.lock"):
+        if os.path.exists(path):
+            os.unlink(path)
@@ -15,22 +15,14 @@ from dcc_mcp_ipc.discovery.factory import ServiceDiscoveryFactory
 from dcc_mcp_ipc.discovery.file_strategy import FileDiscoveryStrategy
 
 
-@pytest.fixture
-def clean_factory():
-    """Fixture to ensure a clean factory for each test."""
-    ServiceDiscoveryFactory._reset_instance()
-    yield
-    ServiceDiscoveryFactory._reset_instance()
-
-
-def test_factory_singleton(clean_factory):
+def test_factory_singleton():
     """Test that ServiceDiscoveryFactory follows the singleton pattern."""
     factory1 = ServiceDiscoveryFactory()
     factory2 = ServiceDiscoveryFactory()
     assert factory1 is factory2
 
 
-def test_get_file_strategy(clean_factory):
+def test_get_file_strategy():
     """Test getting a file discovery strategy."""
     factory = ServiceDiscoveryFactory()
     strategy = factory.get_strategy("file")
@@ -43,7 +35,7 @@ def test_get_file_strategy(clean_factory):
 
 @patch("dcc_mcp_ipc.discovery.factory.ZEROCONF_AVAILABLE", True)
 @patch("dcc_mcp_ipc.discovery.factory.ZeroConfDiscoveryStrategy")
-def test_get_zeroconf_strategy(mock_zeroconf_strategy, clean_factory):
+def test_get_zeroconf_strategy(mock_zeroconf_strategy):
     """Test getting a ZeroConf discovery strategy."""
     # Setup
     mock_instance = MagicMock()
@@ -64,21 +56,21 @@ def test_get_zeroconf_strategy(mock_zeroconf_strategy, clean_factory):
 
 
 @patch("dcc_mcp_ipc.discovery.factory.ZEROCONF_AVAILABLE", False)
-def test_get_unavailable_zeroconf_strategy(clean_factory):
+def test_get_unavailable_zeroconf_strategy():
     """Test getting an unavailable ZeroConf discovery strategy."""
     factory = ServiceDiscoveryFactory()
     strategy = factory.get_strategy("zeroconf")
     assert strategy is None
 
 
-def test_get_invalid_strategy(clean_factory):
+def test_get_invalid_strategy():
     """Test getting an invalid strategy type."""
     factory = ServiceDiscoveryFactory()
     with pytest.raises(ValueError):
         factory.get_strategy("invalid")
 
 
-def test_list_available_strategies(clean_factory):
+def test_list_available_strategies():
     """Test listing available strategies."""
     factory = ServiceDiscoveryFactory()
     strategies = factory.list_available_strategies()
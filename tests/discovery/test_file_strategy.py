@@ -6,31 +6,17 @@ This module contains tests for the FileDiscoveryStrategy class.
 # Import built-in modules
 import json
 import os
-import tempfile
 from unittest.mock import patch
 
 # Import third-party modules
 import pytest
 
 # Import local modules
+from dcc_mcp_ipc.discovery import file_strategy
 from dcc_mcp_ipc.discovery.base import ServiceInfo
 from dcc_mcp_ipc.discovery.file_strategy import FileDiscoveryStrategy
 
 
-@pytest.fixture
-def temp_registry_file():
-    """Fixture to create a temporary registry file."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        f.write(b"{}")
-        registry_path = f.name
-
-    yield registry_path
-
-    # Clean up
-    if os.path.exists(registry_path):
-        os.unlink(registry_path)
-
-
 @pytest.fixture
 def sample_service_info():
     """Fixture to create a sample service info."""
@@ -277,3 +263,347 @@ def test_make_service_key():
     info = ServiceInfo(name="test", host="192.168.1.10", port=9999, dcc_type="houdini")
     key = FileDiscoveryStrategy._make_service_key(info)
     assert key == "houdini:192.168.1.10:9999"
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_registry_round_trip_serializers(temp_registry_file, sample_service_info, orjson_available):
+    """Test the registry round-trips with both the orjson and stdlib json serializers."""
+    if orjson_available:
+        pytest.importorskip("orjson")
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy.ORJSON_AVAILABLE", orjson_available):
+        strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+        assert strategy.register_service(sample_service_info) is True
+
+        # A fresh strategy must read back what the first one wrote
+        services = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services("maya")
+
+    assert len(services) == 1
+    assert services[0].name == "test_service"
+    assert services[0].metadata == {"version": "2023"}
+
+    # The on-disk format stays plain JSON regardless of the serializer
+    with open(temp_registry_file) as f:
+        assert "maya:localhost:8000" in json.load(f)
+
+
+def test_load_registry_reuses_cached_parse(temp_registry_file, sample_service_info):
+    """Test that an unchanged registry file is not parsed again."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    strategy.register_service(sample_service_info)
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy._loads_registry") as mock_loads:
+        services = strategy.discover_services()
+        other_services = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()
+
+    mock_loads.assert_not_called()
+    assert [s.port for s in services] == [8000]
+    assert [s.port for s in other_services] == [8000]
+
+
+def test_load_registry_detects_external_changes(temp_registry_file, sample_service_info):
+    """Test that the registry cache is invalidated when another writer changes the file."""
+    # Import built-in modules
+    import time as time_mod
+
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    strategy.register_service(sample_service_info)
+
+    external_data = {
+        "houdini:127.0.0.1:18820": {
+            "name": "houdini-20",
+            "host": "127.0.0.1",
+            "port": 18820,
+            "dcc_type": "houdini",
+            "timestamp": time_mod.time(),
+            "metadata": {},
+        },
+    }
+    with open(temp_registry_file, "w") as f:
+        json.dump(external_data, f)
+
+    services = strategy.discover_services()
+    assert [s.name for s in services] == ["houdini-20"]
+
+
+def test_load_registry_cache_hit_does_not_open_file(temp_registry_file, sample_service_info):
+    """Test that a registry whose signature matches the cache is not read again."""
+    FileDiscoveryStrategy(registry_path=temp_registry_file).register_service(sample_service_info)
+
+    with patch("builtins.open", side_effect=AssertionError("registry file was read")):
+        services = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()
+
+    assert [s.port for s in services] == [8000]
+
+
+def test_load_registry_ignores_cache_entry_with_other_signature(temp_registry_file, sample_service_info):
+    """Test that a cache entry is only reused when the file signature matches exactly."""
+    FileDiscoveryStrategy(registry_path=temp_registry_file).register_service(sample_service_info)
+    cache_path = os.path.abspath(temp_registry_file)
+    signature, data = file_strategy._REGISTRY_CACHE[cache_path]
+    file_strategy._REGISTRY_CACHE[cache_path] = ((*signature[:-1], signature[-1] + 1), {})
+
+    services = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()
+
+    assert [s.port for s in services] == [8000]
+    assert file_strategy._REGISTRY_CACHE[cache_path] == (signature, data)
+
+
+def test_mutating_discovered_service_does_not_poison_cache(temp_registry_file):
+    """Test that changing a discovered service's metadata leaves the process-wide cache intact."""
+    info = ServiceInfo(name="maya-1", host="127.0.0.1", port=18812, dcc_type="maya", metadata={"scene": {"name": "a"}})
+    FileDiscoveryStrategy(registry_path=temp_registry_file).register_service(info)
+
+    services = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()
+    services[0].metadata["scene"]["name"] = "b"
+    services[0].metadata["extra"] = True
+
+    rediscovered = FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()
+    assert rediscovered[0].metadata == {"scene": {"name": "a"}}
+
+
+def test_mutating_metadata_after_register_does_not_poison_cache(temp_registry_file):
+    """Test that discovery keeps matching the file when the caller changes metadata it registered."""
+    metadata = {"scene": "a", 1: "intkey", "t": (1, 2)}
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    strategy.register_service(
+        ServiceInfo(name="maya-1", host="127.0.0.1", port=18812, dcc_type="maya", metadata=metadata)
+    )
+    metadata["scene"] = "MUTATED"
+
+    with open(temp_registry_file) as f:
+        on_disk = json.load(f)["maya:127.0.0.1:18812"]["metadata"]
+    assert on_disk == {"scene": "a", "1": "intkey", "t": [1, 2]}
+    assert strategy.discover_services()[0].metadata == on_disk
+    assert FileDiscoveryStrategy(registry_path=temp_registry_file).discover_services()[0].metadata == on_disk
+
+
+def test_save_registry_replaces_file_atomically(temp_registry_file, sample_service_info):
+    """Test that saving swaps in a complete file and leaves no temporary files behind."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy.os.replace", wraps=os.replace) as mock_replace:
+        assert strategy.register_service(sample_service_info) is True
+
+    temp_path, target_path = mock_replace.call_args[0]
+    assert target_path == temp_registry_file
+    assert not os.path.exists(temp_path)
+
+    with open(temp_registry_file) as f:
+        assert "maya:localhost:8000" in json.load(f)
+
+
+def test_save_registry_cleans_up_on_failure(temp_registry_file, sample_service_info):
+    """Test that a failed swap removes the temporary file and keeps the previous registry."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy.os.replace", side_effect=OSError("busy")):
+        strategy.register_service(sample_service_info)
+
+    registry_dir = os.path.dirname(temp_registry_file)
+    prefix = os.path.basename(temp_registry_file) + "."
+    assert not [name for name in os.listdir(registry_dir) if name.startswith(prefix) and name.endswith(".tmp")]
+
+    with open(temp_registry_file) as f:
+        assert json.load(f) == {}
+
+
+@patch("time.time")
+def test_discover_services_filters_stale_entries_only(mock_time, temp_registry_file):
+    """Test that stale entries are dropped while fresh ones in the same registry are kept."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    mock_time.return_value = 1000
+    strategy.register_service(ServiceInfo(name="old-maya", host="127.0.0.1", port=18812, dcc_type="maya"))
+    mock_time.return_value = 1000 + 3600
+    strategy.register_service(ServiceInfo(name="new-maya", host="127.0.0.1", port=18813, dcc_type="maya"))
+
+    # Exactly SERVICE_STALE_SECONDS old is still fresh; one second more is stale
+    assert {s.name for s in strategy.discover_services("maya")} == {"old-maya", "new-maya"}
+    mock_time.return_value = 1000 + 3601
+    assert [s.name for s in strategy.discover_services("maya")] == ["new-maya"]
+
+
+def test_concurrent_registrations_are_not_lost(temp_registry_file):
+    """Test that concurrent writers serialize on the registry lock instead of overwriting each other."""
+    # Import built-in modules
+    from concurrent.futures import ThreadPoolExecutor
+
+    def register(port):
+        strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+        info = ServiceInfo(name=f"maya-{port}", host="127.0.0.1", port=port, dcc_type="maya")
+        return strategy.register_service(info)
+
+    ports = list(range(18812, 18832))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(register, ports))
+
+    with open(temp_registry_file) as f:
+        data = json.load(f)
+    assert {entry["port"] for entry in data.values()} == set(ports)
+
+
+def test_load_registry_skips_unchanged_file_for_same_instance(temp_registry_file, sample_service_info):
+    """Test that an instance reuses its own registry while the file is unchanged."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    strategy.register_service(sample_service_info)
+    services_before = strategy._services
+
+    with (
+        patch.object(strategy, "_save_registry"),
+        patch("dcc_mcp_ipc.discovery.file_strategy._loads_registry") as mock_loads,
+    ):
+        assert strategy.unregister_service(sample_service_info) is True
+
+    mock_loads.assert_not_called()
+    assert strategy._services is services_before
+
+
+def test_failed_save_forces_reload(temp_registry_file, sample_service_info):
+    """Test that a failed save does not leave unsaved entries visible to later loads."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy.os.replace", side_effect=OSError("busy")):
+        assert strategy.register_service(sample_service_info) is False
+
+    assert strategy.discover_services() == []
+
+
+def test_save_registry_retries_replace_while_file_is_open(temp_registry_file, sample_service_info):
+    """Test that a swap refused because a reader holds the registry open is retried."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with (
+        patch(
+            "dcc_mcp_ipc.discovery.file_strategy.os.replace", side_effect=[PermissionError("in use"), None]
+        ) as mock_replace,
+        patch("dcc_mcp_ipc.discovery.file_strategy.os.name", "nt"),
+        patch("dcc_mcp_ipc.discovery.file_strategy.time.sleep") as mock_sleep,
+    ):
+        strategy._save_registry()
+
+    assert mock_replace.call_count == 2
+    mock_sleep.assert_called_once_with(file_strategy.REPLACE_RETRY_DELAY)
+
+
+def test_save_registry_gives_up_after_repeated_permission_errors(temp_registry_file, sample_service_info):
+    """Test that registration reports failure when the registry stays locked by readers."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with (
+        patch("dcc_mcp_ipc.discovery.file_strategy.os.replace", side_effect=PermissionError("in use")) as mock_replace,
+        patch("dcc_mcp_ipc.discovery.file_strategy.os.name", "nt"),
+        patch("dcc_mcp_ipc.discovery.file_strategy.time.sleep"),
+    ):
+        assert strategy.register_service(sample_service_info) is False
+
+    assert mock_replace.call_count == file_strategy.REPLACE_ATTEMPTS
+    with open(temp_registry_file) as f:
+        assert json.load(f) == {}
+
+
+def test_save_registry_does_not_retry_permission_error_on_posix(temp_registry_file, sample_service_info):
+    """Test that a refused swap fails at once where PermissionError cannot clear by waiting."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with (
+        patch("dcc_mcp_ipc.discovery.file_strategy.os.replace", side_effect=PermissionError("denied")) as mock_replace,
+        patch("dcc_mcp_ipc.discovery.file_strategy.os.name", "posix"),
+        patch("dcc_mcp_ipc.discovery.file_strategy.time.sleep") as mock_sleep,
+    ):
+        assert strategy.register_service(sample_service_info) is False
+
+    mock_replace.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("time.time")
+def test_register_throttle_skips_unchanged_heartbeats(mock_time, temp_registry_file, sample_service_info):
+    """Test that re-registering an unchanged service within the throttle window skips the write."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file, register_throttle=5.0)
+
+    mock_time.return_value = 1000
+    assert strategy.register_service(sample_service_info) is True
+
+    # Within the window and unchanged: no write
+    mock_time.return_value = 1003
+    with patch.object(strategy, "_save_registry") as mock_save:
+        assert strategy.register_service(sample_service_info) is True
+    mock_save.assert_not_called()
+
+    # Within the window but changed metadata: written
+    changed = ServiceInfo(
+        name="test_service", host="localhost", port=8000, dcc_type="maya", metadata={"version": "2024"}
+    )
+    with patch.object(strategy, "_save_registry") as mock_save:
+        assert strategy.register_service(changed) is True
+    mock_save.assert_called_once()
+
+    # Outside the window: the timestamp is refreshed
+    mock_time.return_value = 1006
+    assert strategy.register_service(sample_service_info) is True
+    with open(temp_registry_file) as f:
+        assert json.load(f)["maya:localhost:8000"]["timestamp"] == 1006
+
+
+def test_register_without_throttle_always_writes(temp_registry_file, sample_service_info):
+    """Test that the default strategy writes on every registration."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    strategy.register_service(sample_service_info)
+
+    with patch.object(strategy, "_save_registry") as mock_save:
+        strategy.register_service(sample_service_info)
+    mock_save.assert_called_once()
+
+
+def test_load_missing_registry_uses_single_stat(tmp_path):
+    """Test that a missing registry file is detected from one stat call without an exists() check."""
+    registry_path = str(tmp_path / "missing.json")
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy.os.path.exists") as mock_exists:
+        strategy = FileDiscoveryStrategy(registry_path=registry_path)
+
+    mock_exists.assert_not_called()
+    assert strategy.discover_services() == []
+
+
+def test_register_services_writes_once(temp_registry_file):
+    """Test that a bulk registration stores every service with a single registry write."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+    maya = ServiceInfo(name="maya-1", host="127.0.0.1", port=18812, dcc_type="maya")
+    houdini = ServiceInfo(name="houdini-1", host="127.0.0.1", port=18820, dcc_type="houdini")
+
+    with patch.object(strategy, "_save_registry", wraps=strategy._save_registry) as mock_save:
+        assert strategy.register_services([maya, houdini]) is True
+    mock_save.assert_called_once()
+
+    with open(temp_registry_file) as f:
+        data = json.load(f)
+    assert set(data) == {"maya:127.0.0.1:18812", "houdini:127.0.0.1:18820"}
+    assert data["maya:127.0.0.1:18812"]["timestamp"] == data["houdini:127.0.0.1:18820"]["timestamp"]
+
+
+@patch("time.time")
+def test_register_services_skips_write_for_unchanged_heartbeats(mock_time, temp_registry_file, sample_service_info):
+    """Test that a bulk registration honours the register throttle."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file, register_throttle=5.0)
+
+    mock_time.return_value = 1000
+    assert strategy.register_services([sample_service_info]) is True
+
+    mock_time.return_value = 1003
+    with (
+        patch.object(strategy, "_save_registry") as mock_save,
+        patch("dcc_mcp_ipc.discovery.file_strategy.logger") as mock_logger,
+    ):
+        assert strategy.register_services([sample_service_info]) is True
+    mock_save.assert_not_called()
+    assert "Registered 0 services" in mock_logger.info.call_args.args[0]
+
+
+def test_register_services_lock_failure_returns_false(temp_registry_file, sample_service_info):
+    """Test that a bulk registration reports failure when the registry cannot be locked."""
+    strategy = FileDiscoveryStrategy(registry_path=temp_registry_file)
+
+    with patch("dcc_mcp_ipc.discovery.file_strategy._registry_file_lock", side_effect=OSError("locked")):
+        assert strategy.register_services([sample_service_info]) is False
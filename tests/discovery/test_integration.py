@@ -4,8 +4,6 @@ This module contains tests for the integration of multiple service discovery str
 """
 
 # Import built-in modules
-import os
-import tempfile
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -18,27 +16,6 @@ from dcc_mcp_ipc.discovery.file_strategy import FileDiscoveryStrategy
 from dcc_mcp_ipc.discovery.registry import ServiceRegistry
 
 
-@pytest.fixture
-def clean_registry():
-    """Ensure the registry is reset before and after each test."""
-    ServiceRegistry._reset_instance()
-    yield
-    ServiceRegistry._reset_instance()
-
-
-@pytest.fixture
-def temp_registry_file():
-    """Create a temporary registry file."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as f:
-        f.write(b"{}")
-        registry_path = f.name
-
-    yield registry_path
-
-    if os.path.exists(registry_path):
-        os.unlink(registry_path)
-
-
 @pytest.fixture
 def sample_service_info():
     """Create a sample service information."""
@@ -51,7 +28,7 @@ def sample_service_info():
     )
 
 
-def test_multiple_strategies_registration(clean_registry, temp_registry_file, sample_service_info):
+def test_multiple_strategies_registration(temp_registry_file, sample_service_info):
     """Test registration of services using multiple strategies."""
     # Setup
     registry = ServiceRegistry()
@@ -79,7 +56,7 @@ def test_multiple_strategies_registration(clean_registry, temp_registry_file, sa
     mock_file_strategy.register_service.assert_called_once_with(sample_service_info)
 
 
-def test_multiple_strategies_discovery(clean_registry, temp_registry_file, sample_service_info):
+def test_multiple_strategies_discovery(temp_registry_file, sample_service_info):
     """Test discovery of services using multiple strategies."""
     # Setup
     registry = ServiceRegistry()
@@ -107,7 +84,7 @@ def test_multiple_strategies_discovery(clean_registry, temp_registry_file, sampl
     mock_file_strategy.discover_services.assert_called_once()
 
 
-def test_discover_all_services(clean_registry, temp_registry_file, sample_service_info):
+def test_discover_all_services(temp_registry_file, sample_service_info):
     """Test discovery of all services."""
     # Setup
     with patch.object(ServiceRegistry, "discover_services") as mock_discover_services:
@@ -127,7 +104,7 @@ def test_discover_all_services(clean_registry, temp_registry_file, sample_servic
         assert mock_discover_services.call_count == 2
 
 
-def test_get_service_from_multiple_strategies(clean_registry, temp_registry_file, sample_service_info):
+def test_get_service_from_multiple_strategies(temp_registry_file, sample_service_info):
     """Test getting a service from multiple strategies."""
     # Setup
     with patch.object(ServiceRegistry, "discover_services") as mock_discover_services:
@@ -147,7 +124,7 @@ def test_get_service_from_multiple_strategies(clean_registry, temp_registry_file
         mock_discover_services.assert_called_once_with("file", dcc_type="maya")
 
 
-def test_register_service_with_strategy_helper(clean_registry, temp_registry_file, sample_service_info):
+def test_register_service_with_strategy_helper(temp_registry_file, sample_service_info):
     """Test registering a service with a strategy helper."""
     # Setup
     registry = ServiceRegistry()
@@ -164,7 +141,7 @@ def test_register_service_with_strategy_helper(clean_registry, temp_registry_fil
     mock_file_strategy.register_service.assert_called_once_with(sample_service_info)
 
 
-def test_register_service_with_strategy_helper_unregister(clean_registry, temp_registry_file, sample_service_info):
+def test_register_service_with_strategy_helper_unregister(temp_registry_file, sample_service_info):
     """Test unregistering a service using a strategy."""
     # Setup
     registry = ServiceRegistry()
@@ -14,14 +14,6 @@ from dcc_mcp_ipc.discovery.base import ServiceInfo
 from dcc_mcp_ipc.discovery.registry import ServiceRegistry
 
 
-@pytest.fixture
-def clean_registry():
-    """Fixture to ensure a clean registry for each test."""
-    ServiceRegistry._reset_instance()
-    yield
-    ServiceRegistry._reset_instance()
-
-
 @pytest.fixture
 def mock_strategy():
     """Fixture to create a mock strategy."""
@@ -38,14 +30,14 @@ def sample_service_info():
     return ServiceInfo(name="test_service", host="localhost", port=8000, dcc_type="maya", metadata={"version": "2023"})
 
 
-def test_registry_singleton(clean_registry):
+def test_registry_singleton():
     """Test that ServiceRegistry follows the singleton pattern."""
     registry1 = ServiceRegistry()
     registry2 = ServiceRegistry()
     assert registry1 is registry2
 
 
-def test_register_strategy(clean_registry, mock_strategy):
+def test_register_strategy(mock_strategy):
     """Test registering a strategy."""
     registry = ServiceRegistry()
     registry.register_strategy("test", mock_strategy)
@@ -53,7 +45,7 @@ def test_register_strategy(clean_registry, mock_strategy):
     assert "test" in registry.list_strategies()
 
 
-def test_discover_services(clean_registry, mock_strategy, sample_service_info):
+def test_discover_services(mock_strategy, sample_service_info):
     """Test discovering services."""
     # Setup
     registry = ServiceRegistry()
@@ -69,7 +61,7 @@ def test_discover_services(clean_registry, mock_strategy, sample_service_info):
     mock_strategy.discover_services.assert_called_once_with(None)
 
 
-def test_discover_services_with_type(clean_registry, mock_strategy, sample_service_info):
+def test_discover_services_with_type(mock_strategy, sample_service_info):
     """Test discovering services with a specific type."""
     # Setup
     registry = ServiceRegistry()
@@ -85,14 +77,14 @@ def test_discover_services_with_type(clean_registry, mock_strategy, sample_servi
     mock_strategy.discover_services.assert_called_once_with("maya")
 
 
-def test_discover_services_strategy_not_found(clean_registry):
+def test_discover_services_strategy_not_found():
     """Test discovering services with a non-existent strategy."""
     registry = ServiceRegistry()
     with pytest.raises(ValueError):
         registry.discover_services("non_existent")
 
 
-def test_register_service(clean_registry, mock_strategy, sample_service_info):
+def test_register_service(mock_strategy, sample_service_info):
     """Test registering a service."""
     # Setup
     registry = ServiceRegistry()
@@ -106,14 +98,14 @@ def test_register_service(clean_registry, mock_strategy, sample_service_info):
     mock_strategy.register_service.assert_called_once_with(sample_service_info)
 
 
-def test_register_service_strategy_not_found(clean_registry, sample_service_info):
+def test_register_service_strategy_not_found(sample_service_info):
     """Test registering a service with a non-existent strategy."""
     registry = ServiceRegistry()
     with pytest.raises(ValueError):
         registry.register_service("non_existent", sample_service_info)
 
 
-def test_unregister_service(clean_registry, mock_strategy, sample_service_info):
+def test_unregister_service(mock_strategy, sample_service_info):
     """Test unregistering a service."""
     # Setup
     registry = ServiceRegistry()
@@ -128,14 +120,14 @@ def test_unregister_service(clean_registry, mock_strategy, sample_service_info):
     mock_strategy.unregister_service.assert_called_once_with(sample_service_info)
 
 
-def test_unregister_service_strategy_not_found(clean_registry, sample_service_info):
+def test_unregister_service_strategy_not_found(sample_service_info):
     """Test unregistering a service with a non-existent strategy."""
     registry = ServiceRegistry()
     with pytest.raises(ValueError):
         registry.unregister_service("non_existent", sample_service_info)
 
 
-def test_get_service(clean_registry, mock_strategy, sample_service_info):
+def test_get_service(mock_strategy, sample_service_info):
     """Test getting a service by DCC type and name."""
     # Setup
     registry = ServiceRegistry()
@@ -150,7 +142,7 @@ def test_get_service(clean_registry, mock_strategy, sample_service_info):
     assert service == sample_service_info
 
 
-def test_get_service_by_dcc_type_only(clean_registry, mock_strategy, sample_service_info):
+def test_get_service_by_dcc_type_only(mock_strategy, sample_service_info):
     """Test getting a service by DCC type only."""
     # Setup
     registry = ServiceRegistry()
@@ -165,14 +157,14 @@ def test_get_service_by_dcc_type_only(clean_registry, mock_strategy, sample_serv
     assert service == sample_service_info
 
 
-def test_get_service_not_found(clean_registry):
+def test_get_service_not_found():
     """Test getting a non-existent service."""
     registry = ServiceRegistry()
     service = registry.get_service("non_existent")
     assert service is None
 
 
-def test_list_services(clean_registry, mock_strategy, sample_service_info):
+def test_list_services(mock_strategy, sample_service_info):
     """Test listing all services."""
     # Setup
     registry = ServiceRegistry()
@@ -188,7 +180,7 @@ def test_list_services(clean_registry, mock_strategy, sample_service_info):
     assert services[0] == sample_service_info
 
 
-def test_list_services_by_dcc_type(clean_registry, mock_strategy, sample_service_info):
+def test_list_services_by_dcc_type(mock_strategy, sample_service_info):
     """Test listing services filtered by DCC type."""
     # Setup
     registry = ServiceRegistry()
@@ -18,21 +18,13 @@ from dcc_mcp_ipc.discovery.zeroconf_strategy import ZEROCONF_AVAILABLE
 from dcc_mcp_ipc.discovery.zeroconf_strategy import ZeroConfDiscoveryStrategy
 
 
-@pytest.fixture
-def clean_registry():
-    """Fixture to ensure a clean registry for each test."""
-    ServiceRegistry._reset_instance()
-    yield
-    ServiceRegistry._reset_instance()
-
-
 @pytest.fixture
 def sample_service_info():
     """Fixture to create a sample service info."""
     return ServiceInfo(name="test_service", host="localhost", port=8000, dcc_type="maya", metadata={"version": "2023"})
 
 
-def test_ensure_strategy_file(clean_registry):
+def test_ensure_strategy_file():
     """Test ensuring a file strategy exists."""
     # Setup
     registry = ServiceRegistry()
@@ -46,7 +38,7 @@ def test_ensure_strategy_file(clean_registry):
 
 
 @pytest.mark.skipif(not ZEROCONF_AVAILABLE, reason="ZeroConf is not available")
-def test_ensure_strategy_zeroconf(clean_registry):
+def test_ensure_strategy_zeroconf():
     """Test ensuring a ZeroConf strategy exists."""
     # Setup
     registry = ServiceRegistry()
@@ -59,7 +51,7 @@ def test_ensure_strategy_zeroconf(clean_registry):
     assert registry.get_strategy("zeroconf") is strategy
 
 
-def test_ensure_strategy_with_kwargs(clean_registry):
+def test_ensure_strategy_with_kwargs():
     """Test ensuring a strategy exists with keyword arguments."""
     # Setup
     registry = ServiceRegistry()
@@ -74,7 +66,7 @@ def test_ensure_strategy_with_kwargs(clean_registry):
     assert strategy is mock_strategy
 
 
-def test_ensure_strategy_invalid_type(clean_registry):
+def test_ensure_strategy_invalid_type():
     """Test ensuring an invalid strategy type."""
     # Setup
     registry = ServiceRegistry()
@@ -84,7 +76,7 @@ def test_ensure_strategy_invalid_type(clean_registry):
         registry.ensure_strategy("invalid")
 
 
-def test_register_service_with_strategy(clean_registry, sample_service_info):
+def test_register_service_with_strategy(sample_service_info):
     """Test registering a service with a strategy."""
     # Setup
     registry = ServiceRegistry()
@@ -100,7 +92,7 @@ def test_register_service_with_strategy(clean_registry, sample_service_info):
     mock_strategy.register_service.assert_called_once_with(sample_service_info)
 
 
-def test_register_service_with_strategy_ensure(clean_registry, sample_service_info):
+def test_register_service_with_strategy_ensure(sample_service_info):
     """Test registering a service with a strategy, ensuring the strategy exists."""
     # Setup
     registry = ServiceRegistry()
@@ -123,7 +115,7 @@ def test_register_service_with_strategy_ensure(clean_registry, sample_service_in
     mock_register_service.assert_called_once()
 
 
-def test_register_service_with_strategy_unregister(clean_registry, sample_service_info):
+def test_register_service_with_strategy_unregister(sample_service_info):
     """Test unregistering a service with a strategy."""
     # Setup
     registry = ServiceRegistry()
@@ -139,7 +131,7 @@ def test_register_service_with_strategy_unregister(clean_registry, sample_servic
     mock_strategy.unregister_service.assert_called_once_with(sample_service_info)
 
 
-def test_register_service_with_strategy_failure(clean_registry, sample_service_info):
+def test_register_service_with_strategy_failure(sample_service_info):
     """Test registering a service with a strategy that fails."""
     # Setup
     registry = ServiceRegistry()
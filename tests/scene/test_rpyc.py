@@ -485,6 +485,33 @@ class TestSceneMetadata:
         meta = rpyc_scene._get_scene_metadata()
         assert "frame_range" in meta
 
+    def test_maya_metadata_single_call(self, rpyc_scene, mock_execute) -> None:
+        mock_execute.return_value = ((1.0, 120.0), 12.0, "cm")
+        meta = rpyc_scene._get_scene_metadata()
+        assert meta == {"frame_range": [1.0, 120.0], "current_frame": 12.0, "units": "cm"}
+        mock_execute.assert_called_once()
+
+    def test_maya_metadata_odd_frame_range_keeps_other_fields(self, rpyc_scene, mock_execute) -> None:
+        mock_execute.return_value = (None, 12.0, "cm")
+        meta = rpyc_scene._get_scene_metadata()
+        assert meta == {"frame_range": (1, 120), "current_frame": 12.0, "units": "cm"}
+
+    def test_maya_metadata_malformed_result_queries_each_field(self, rpyc_scene, mock_execute) -> None:
+        mock_execute.side_effect = [(1.0, 120.0), (1.0, 120.0), 12.0, "cm"]
+        meta = rpyc_scene._get_scene_metadata()
+        assert meta == {"frame_range": [1.0, 120.0], "current_frame": 12.0, "units": "cm"}
+        assert mock_execute.call_count == 4
+
+    def test_maya_metadata_failed_field_keeps_other_fields(self, rpyc_scene, mock_execute) -> None:
+        mock_execute.side_effect = [
+            Exception("currentTime failed"),
+            (1.0, 120.0),
+            Exception("currentTime failed"),
+            "cm",
+        ]
+        meta = rpyc_scene._get_scene_metadata()
+        assert meta == {"frame_range": [1.0, 120.0], "units": "cm"}
+
     def test_blender_scene_name(self, mock_execute) -> None:
         mock_execute.return_value = "untitled.blend"
         si = RPyCSceneInfo(dcc_name="blender", execute_func=mock_execute)
@@ -574,21 +601,21 @@ class TestSceneMetadataExtended:
 
     def test_blender_metadata(self, mock_execute) -> None:
         """Test Blender-specific metadata."""
+        mock_execute.return_value = (1, 300, 42)
 
-        def side_effect(code: str):
-            if code.endswith("frame_start"):
-                return 1
-            if code.endswith("frame_end"):
-                return 300
-            if code.endswith("frame_current"):
-                return 42
-            return ""
+        si = RPyCSceneInfo(dcc_name="blender", execute_func=mock_execute)
+        meta = si._get_scene_metadata()
+        assert meta == {"frame_start": 1, "frame_end": 300, "current_frame": 42}
+        # All three values come back from a single remote call
+        mock_execute.assert_called_once()
 
-        mock_execute.side_effect = side_effect
+    def test_blender_metadata_failed_field_keeps_other_fields(self, mock_execute) -> None:
+        """A field that cannot be queried is dropped without losing the others."""
+        mock_execute.side_effect = [Exception("frame_end failed"), 1, Exception("frame_end failed"), 42]
 
         si = RPyCSceneInfo(dcc_name="blender", execute_func=mock_execute)
         meta = si._get_scene_metadata()
-        assert meta == {"frame_start": 1, "frame_end": 300, "current_frame": 42}
+        assert meta == {"frame_start": 1, "current_frame": 42}
 
 
 # =============================================================================
@@ -1,12 +1,14 @@
 """Tests for dcc_mcp_ipc.server.dcc module (DCCServer and DCCRPyCService)."""
 
 # Import built-in modules
+import threading
 from typing import Any
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 # Import third-party modules
 import pytest
+import rpyc
 
 # Import local modules
 from dcc_mcp_ipc.server.dcc import DCCRPyCService
@@ -246,6 +248,109 @@ class TestDCCServerStart:
         assert server.running is True
         assert server.registry_file == "/tmp/reg.json"
 
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_start_in_thread_listen_failure_returns_false(self, mock_reg):
+        """A server that fails to start listening is reported as a failure and never registered."""
+        mock_srv = MagicMock()
+        mock_srv.active = False
+        mock_srv.start.side_effect = OSError("address already in use")
+        server = DCCServer(dcc_name="maya", server=mock_srv)
+        server.use_zeroconf = False
+
+        result = server.start(threaded=True)
+        assert result is False
+        assert server.running is False
+        mock_srv.close.assert_called_once()
+        assert server.server is None
+        mock_reg.assert_not_called()
+
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_start_in_thread_timeout_closes_server(self, mock_reg):
+        """A server that does not start listening in time is closed so it cannot keep serving untracked."""
+        closed = threading.Event()
+        mock_srv = MagicMock()
+        mock_srv.active = False
+        mock_srv.start.side_effect = lambda: closed.wait(5)
+        mock_srv.close.side_effect = closed.set
+        server = DCCServer(dcc_name="maya", server=mock_srv)
+        server.use_zeroconf = False
+
+        with patch("dcc_mcp_ipc.server.dcc.SERVER_START_TIMEOUT", 0.05):
+            assert server.start(threaded=True) is False
+
+        mock_srv.close.assert_called_once()
+        assert server.server is None
+        mock_reg.assert_not_called()
+
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_start_in_thread_is_listening_on_return(self, mock_reg):
+        """start(threaded=True) only returns once the real server is accepting connections."""
+        mock_reg.return_value = "/tmp/reg.json"
+        server = DCCServer(dcc_name="maya", service_class=_ConcreteDCCService, host="127.0.0.1")
+        server.use_zeroconf = False
+
+        try:
+            port = server.start(threaded=True)
+            assert port
+            assert server.server.active is True
+            conn = rpyc.connect("127.0.0.1", port)
+            conn.ping()
+            conn.close()
+        finally:
+            server.close()
+
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_start_in_thread_sets_ready_event(self, mock_reg):
+        """The ready event is set once the threaded server is listening and registered."""
+        mock_reg.return_value = "/tmp/reg.json"
+        server = DCCServer(dcc_name="maya", service_class=_ConcreteDCCService, host="127.0.0.1")
+        server.use_zeroconf = False
+        ready = threading.Event()
+
+        try:
+            port = server.start(threaded=True, ready=ready)
+            assert ready.wait(timeout=5.0)
+            assert server.registry_file == "/tmp/reg.json"
+            conn = rpyc.connect("127.0.0.1", port)
+            conn.ping()
+            conn.close()
+        finally:
+            server.close()
+
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_start_in_thread_failure_leaves_ready_unset(self, mock_reg):
+        """A server that fails to listen never sets the ready event."""
+        mock_srv = MagicMock()
+        mock_srv.active = False
+        mock_srv.start.side_effect = OSError("address already in use")
+        server = DCCServer(dcc_name="maya", server=mock_srv)
+        server.use_zeroconf = False
+        ready = threading.Event()
+
+        assert server.start(threaded=True, ready=ready) is False
+        assert not ready.is_set()
+
+    @patch("dcc_mcp_ipc.server.dcc.unregister_dcc_service")
+    @patch("dcc_mcp_ipc.server.dcc.register_dcc_service")
+    def test_restart_reuses_instance_and_port(self, mock_reg, mock_unreg):
+        """stop() then start() on the same instance serves again on the port clients already know."""
+        mock_reg.return_value = "/tmp/reg.json"
+        server = DCCServer(dcc_name="maya", service_class=_ConcreteDCCService, host="127.0.0.1")
+        server.use_zeroconf = False
+
+        try:
+            port = server.start(threaded=True)
+            assert port
+            assert server.stop() is True
+            assert server.server is None
+
+            assert server.start(threaded=True) == port
+            conn = rpyc.connect("127.0.0.1", port)
+            conn.ping()
+            conn.close()
+        finally:
+            server.close()
+
     def test_start_exception_returns_false(self):
         server = DCCServer(dcc_name="maya")
         server.service_class = None  # This will cause _create_server to fail
@@ -2,14 +2,18 @@
 
 # Import built-in modules
 import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 # Import third-party modules
 import pytest
+import rpyc
+from rpyc.utils.server import ThreadedServer
 
 # Import local modules
 from dcc_mcp_ipc.server import lifecycle as lifecycle_module
+from dcc_mcp_ipc.server.dcc import DCCServer
 from dcc_mcp_ipc.server.lifecycle import create_server
 from dcc_mcp_ipc.server.lifecycle import is_server_running
 from dcc_mcp_ipc.server.lifecycle import start_server
@@ -137,6 +141,53 @@ class TestStartServer:
         assert isinstance(thread, threading.Thread)
         assert thread.daemon is True  # default daemon=True
 
+    def test_start_failure_raises_and_is_not_marked_running(self):
+        mock_server = self._make_mock_server()
+        mock_server.active = False
+        mock_server.start.side_effect = OSError("address already in use")
+
+        with pytest.raises(OSError, match="address already in use"):
+            start_server(mock_server)
+        assert is_server_running(mock_server) is False
+        mock_server.close.assert_called_once()
+        assert lifecycle_module._servers == {}
+
+    def test_start_returning_false_raises_failed_to_start(self):
+        mock_server = MagicMock(spec=DCCServer)
+        mock_server.host = "localhost"
+        mock_server.port = 18812
+        mock_server.is_running.return_value = False
+        mock_server.start.return_value = False
+
+        with pytest.raises(RuntimeError, match="failed to start"):
+            start_server(mock_server)
+        mock_server.close.assert_called_once()
+        assert lifecycle_module._servers == {}
+
+    def test_start_timeout_closes_server(self):
+        closed = threading.Event()
+        mock_server = self._make_mock_server()
+        mock_server.active = False
+        mock_server.start.side_effect = lambda: closed.wait(5)
+        mock_server.close.side_effect = closed.set
+
+        with patch("dcc_mcp_ipc.server.lifecycle.SERVER_START_TIMEOUT", 0.05):
+            with pytest.raises(RuntimeError, match="did not start listening"):
+                start_server(mock_server)
+        mock_server.close.assert_called_once()
+        assert lifecycle_module._servers == {}
+
+    def test_start_returns_once_listening(self):
+        server = ThreadedServer(rpyc.SlaveService, hostname="127.0.0.1", port=0)
+        try:
+            start_server(server)
+            assert server.active is True
+            conn = rpyc.connect("127.0.0.1", server.port)
+            conn.ping()
+            conn.close()
+        finally:
+            server.close()
+
 
 class TestStopServer:
     """Tests for the stop_server function."""
@@ -155,9 +206,7 @@ class TestStopServer:
     @patch("dcc_mcp_ipc.server.lifecycle.cleanup_server")
     def test_stop_running_server(self, mock_cleanup):
         mock_cleanup.return_value = True
-        mock_server = MagicMock()
-        mock_server.host = "localhost"
-        mock_server.port = 0
+        mock_server = SimpleNamespace(host="localhost", port=0)
 
         self._register_server(mock_server, running=True)
         result = stop_server(mock_server)
@@ -166,12 +215,12 @@ class TestStopServer:
         mock_cleanup.assert_called_once()
 
     def test_stop_server_not_in_registry(self):
-        mock_server = MagicMock()
+        mock_server = object()
         result = stop_server(mock_server)
         assert result is False
 
     def test_stop_server_not_running(self):
-        mock_server = MagicMock()
+        mock_server = object()
         self._register_server(mock_server, running=False)
 
         result = stop_server(mock_server)
@@ -180,9 +229,7 @@ class TestStopServer:
     @patch("dcc_mcp_ipc.server.lifecycle.cleanup_server")
     def test_stop_server_cleanup_fails(self, mock_cleanup):
         mock_cleanup.side_effect = RuntimeError("cleanup error")
-        mock_server = MagicMock()
-        mock_server.host = "localhost"
-        mock_server.port = 0
+        mock_server = SimpleNamespace(host="localhost", port=0)
 
         self._register_server(mock_server, running=True)
         result = stop_server(mock_server)
@@ -194,7 +241,7 @@ class TestIsServerRunning:
     """Tests for the is_server_running function."""
 
     def test_running_server(self):
-        mock_server = MagicMock()
+        mock_server = object()
         lifecycle_module._servers["run_test"] = {
             "server": mock_server,
             "running": True,
@@ -202,7 +249,7 @@ class TestIsServerRunning:
         assert is_server_running(mock_server) is True
 
     def test_stopped_server(self):
-        mock_server = MagicMock()
+        mock_server = object()
         lifecycle_module._servers["stop_test"] = {
             "server": mock_server,
             "running": False,
@@ -210,5 +257,5 @@ class TestIsServerRunning:
         assert is_server_running(mock_server) is False
 
     def test_unregistered_server(self):
-        mock_server = MagicMock()
+        mock_server = object()
         assert is_server_running(mock_server) is False
@@ -1,6 +1,6 @@
 """Tests for server/server_utils.py.
 
-Covers get_rpyc_config and create_raw_threaded_server.
+Covers get_rpyc_config, poll_for and create_raw_threaded_server.
 """
 
 # Import built-in modules
@@ -13,6 +13,7 @@ import pytest
 # Import local modules
 from dcc_mcp_ipc.server.server_utils import create_raw_threaded_server
 from dcc_mcp_ipc.server.server_utils import get_rpyc_config
+from dcc_mcp_ipc.server.server_utils import poll_for
 
 
 class TestGetRpycConfig:
@@ -48,6 +49,37 @@ class TestGetRpycConfig:
         assert isinstance(config, dict)
 
 
+class TestPollFor:
+    """Tests for poll_for."""
+
+    def test_returns_immediately_when_predicate_true(self):
+        """Test that a true predicate is only checked once."""
+        predicate = MagicMock(return_value=True)
+        with patch("dcc_mcp_ipc.server.server_utils.time.sleep") as mock_sleep:
+            assert poll_for(predicate) is True
+        predicate.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_polls_until_predicate_true(self):
+        """Test that the predicate is re-checked until it becomes true."""
+        predicate = MagicMock(side_effect=[False, False, True])
+        with patch("dcc_mcp_ipc.server.server_utils.time.sleep") as mock_sleep:
+            assert poll_for(predicate, interval=0.001) is True
+        assert predicate.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_deadline_uses_monotonic_clock(self):
+        """Test that the deadline follows time.monotonic, not the wall clock."""
+        with patch("dcc_mcp_ipc.server.server_utils.time.monotonic", side_effect=[0.0, 0.0, 10.0]):
+            with patch("dcc_mcp_ipc.server.server_utils.time.sleep") as mock_sleep:
+                assert poll_for(lambda: False, timeout=5.0) is False
+        mock_sleep.assert_called_once_with(0.005)
+
+    def test_returns_false_on_timeout(self):
+        """Test that poll_for gives up once the timeout expires."""
+        assert poll_for(lambda: False, timeout=0.05, interval=0.01) is False
+
+
 class TestCreateRawThreadedServer:
     """Tests for create_raw_threaded_server."""
 
@@ -5,9 +5,11 @@ These tests require a running DCC application with the DCC-MCP-IPC server instal
 """
 
 # Import built-in modules
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
 import sys
 import threading
-import time
 
 # Import third-party modules
 import pytest
@@ -19,6 +21,8 @@ from dcc_mcp_ipc.client import BaseDCCClient
 from dcc_mcp_ipc.discovery import FileDiscoveryStrategy
 from dcc_mcp_ipc.discovery import ServiceInfo
 from dcc_mcp_ipc.discovery import ServiceRegistry
+from dcc_mcp_ipc.server.server_utils import SERVER_START_TIMEOUT
+from dcc_mcp_ipc.server.server_utils import poll_for
 
 
 # Mock DCC service class
@@ -78,8 +82,31 @@ class MockDCCService(rpyc.Service):
         }
 
 
+logger = logging.getLogger(__name__)
+
+# Seconds before a synchronous RPyC request is abandoned, so a deadlocked mock server fails fast
+RPYC_SYNC_REQUEST_TIMEOUT = 5
+
 _mock_servers = {}
 
+# Connected clients keyed by (host, port), reused so each test does not pay a fresh handshake
+_client_cache = {}
+
+
+def _close_client(client):
+    """Close a cached client, ignoring errors from a connection that has already dropped."""
+    try:
+        client.close()
+    except Exception as e:
+        logger.warning(f"Error closing cached client: {e}")
+
+
+def _close_cached_clients():
+    """Close and forget every cached client."""
+    for client in _client_cache.values():
+        _close_client(client)
+    _client_cache.clear()
+
 
 def start_mock_dcc_service(dcc_name, host="localhost", port=0):
     """Start a mock DCC service.
@@ -97,7 +124,7 @@ def start_mock_dcc_service(dcc_name, host="localhost", port=0):
 
     # Check if the service is already running
     if dcc_name in _mock_servers:
-        server, host, port = _mock_servers[dcc_name]
+        server, host, port, service_info = _mock_servers[dcc_name]
         return host, port
 
     # Create a service instance with the specified DCC name
@@ -108,21 +135,28 @@ def start_mock_dcc_service(dcc_name, host="localhost", port=0):
         service,
         hostname=host,
         port=port,
-        protocol_config={"allow_all_attrs": True},
+        protocol_config={"allow_all_attrs": True, "sync_request_timeout": RPYC_SYNC_REQUEST_TIMEOUT},
     )
 
     # Start the server in a separate thread
     server_thread = threading.Thread(target=server.start, daemon=True)
     server_thread.start()
 
-    # Wait for the server to start
-    time.sleep(0.1)
+    # Wait for the server to start listening and fail fast if it never does
+    if not poll_for(lambda: server.active, timeout=SERVER_START_TIMEOUT):
+        server.close()
+        pytest.fail(
+            f"Mock {dcc_name} service did not start listening on {host}:{server.port} "
+            f"within {SERVER_START_TIMEOUT} seconds"
+        )
 
     # Get the port that was assigned
     port = server.port
 
-    # Store the server instance
-    _mock_servers[dcc_name] = (server, host, port)
+    service_info = ServiceInfo(name=dcc_name, host=host, port=port, dcc_type=dcc_name, metadata={"version": "1.0.0"})
+
+    # Store the server instance together with the exact ServiceInfo used for registration
+    _mock_servers[dcc_name] = (server, host, port, service_info)
 
     # Register the service
     registry = ServiceRegistry()
@@ -131,7 +165,6 @@ def start_mock_dcc_service(dcc_name, host="localhost", port=0):
         strategy = FileDiscoveryStrategy()
         registry.register_strategy("file", strategy)
 
-    service_info = ServiceInfo(name=dcc_name, host=host, port=port, dcc_type=dcc_name, metadata={"version": "1.0.0"})
     registry.register_service("file", service_info)
 
     return host, port
@@ -147,40 +180,53 @@ def stop_mock_dcc_service(dcc_name):
     global _mock_servers
 
     if dcc_name in _mock_servers:
-        server, host, port = _mock_servers[dcc_name]
+        server, _, _, service_info = _mock_servers[dcc_name]
         server.close()
 
-        # Unregister the service
+        # Unregister the service with the ServiceInfo stored at registration time
         registry = ServiceRegistry()
         strategy = registry.get_strategy("file")
         if strategy:
-            service_info = ServiceInfo(
-                name=dcc_name, host=host, port=port, dcc_type=dcc_name, metadata={"version": "1.0.0"}
-            )
             registry.unregister_service("file", service_info)
 
         del _mock_servers[dcc_name]
 
 
-@pytest.fixture
-def mock_dcc_services():
-    """Start mock DCC services."""
-    # Start mock services for common DCCs
-    start_mock_dcc_service("maya")
-    start_mock_dcc_service("houdini")
-    start_mock_dcc_service("nuke")
+def _safe_stop(dcc_name):
+    """Stop a mock DCC service, logging instead of raising on failure.
 
-    yield
+    Args:
+        dcc_name: DCC name
 
-    # Stop all mock services
-    for dcc_name in list(_mock_servers.keys()):
+    """
+    try:
         stop_mock_dcc_service(dcc_name)
+    except Exception as e:
+        logger.warning(f"Error stopping mock {dcc_name} service: {e}")
+        _mock_servers.pop(dcc_name, None)
+
 
+@pytest.fixture(scope="module", autouse=True)
+def _integration_cleanup():
+    """Close cached clients and stop the mock DCC services started by the module's tests."""
+    try:
+        yield
+    finally:
+        # Close cached clients before their servers go away
+        _close_cached_clients()
 
-# Skip tests if no DCC services are available
+        # Stop all mock services concurrently; one failing close must not leak the others
+        dcc_names = list(_mock_servers.keys())
+        if dcc_names:
+            with ThreadPoolExecutor(max_workers=len(dcc_names)) as executor:
+                list(executor.map(_safe_stop, dcc_names))
+
+
+# Skip tests unless explicitly requested and DCC services are available.
+# The environment check short-circuits so opting out never touches the registry.
 pytestmark = pytest.mark.skipif(
-    not ServiceRegistry().list_services(),  # Check if any DCC services are available
-    reason="No DCC services available for testing",
+    not os.environ.get("DCC_MCP_RUN_INTEGRATION") or not ServiceRegistry().list_services(),
+    reason="DCC integration tests disabled (set DCC_MCP_RUN_INTEGRATION=1) or no DCC services available",
 )
 
 
@@ -210,16 +256,22 @@ def get_test_dcc_client(dcc_name: str):
     if not service:
         # Start a mock service
         host, port = start_mock_dcc_service(dcc_name)
-
-        # Create a client
-        client = BaseDCCClient(host=host, port=port)
-        return client
-
-    # Create a client
-    client = BaseDCCClient(host=service.host, port=service.port)
+    else:
+        host, port = service.host, service.port
+
+    # Reuse a live client for this endpoint and only reconnect after the connection drops
+    key = (host, port)
+    client = _client_cache.get(key)
+    if client is None or not client.is_connected():
+        if client is not None:
+            # Release the dropped connection before replacing it
+            _close_client(client)
+        client = BaseDCCClient(dcc_name, host=host, port=port, connection_timeout=RPYC_SYNC_REQUEST_TIMEOUT)
+        _client_cache[key] = client
     return client
 
 
+@pytest.mark.timeout(10)
 def test_maya_integration():
     """Test integration with Maya."""
     # Get a Maya client
@@ -247,6 +299,7 @@ def test_maya_integration():
     assert result["success"] is True
 
 
+@pytest.mark.timeout(10)
 def test_houdini_integration():
     """Test integration with Houdini."""
     # Get a Houdini client
@@ -269,6 +322,7 @@ def test_houdini_integration():
     assert "objects" in scene_info
 
 
+@pytest.mark.timeout(10)
 def test_nuke_integration():
     """Test integration with Nuke."""
     # Get a Nuke client
@@ -192,9 +192,11 @@ def test_complex_dependency_chain():
 
     # Register the dependencies
     container = Container()
+    # Bind the resolver once so the factories do not look it up through the container on every call
+    resolve_dependency = container.resolve
     container.register_singleton(Database, lambda: Database("test_connection"))
-    container.register_factory(Repository, lambda: Repository(container.resolve(Database)))
-    container.register_factory(Service, lambda logger=None: Service(container.resolve(Repository), logger))
+    container.register_factory(Repository, lambda: Repository(resolve_dependency(Database)))
+    container.register_factory(Service, lambda logger=None: Service(resolve_dependency(Repository), logger))
 
     # Resolve the service
     service = container.resolve(Service)
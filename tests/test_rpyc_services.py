@@ -8,32 +8,62 @@ import sys
 
 # Import third-party modules
 from dcc_mcp_core import ActionResultModel
-
-# Import local modules
-from dcc_mcp_ipc.testing.mock_services import MockDCCService
+import pytest
+
+# Keys every get_environment_info result must contain
+ENVIRONMENT_INFO_KEYS = frozenset(
+    {"python_version", "modules", "sys_path", "environment_variables", "python_path", "platform", "cwd", "os"}
+)
+
+# Abstract methods of ApplicationRPyCService followed by those DCCRPyCService adds
+INTERFACE_METHODS = (
+    "get_application_info",
+    "get_environment_info",
+    "execute_python",
+    "import_module",
+    "call_function",
+    "get_scene_info",
+    "get_session_info",
+    "create_primitive",
+)
+
+# Exposed methods every ApplicationRPyCService must provide
+REQUIRED_APP_METHODS = (
+    "exposed_get_application_info",
+    "exposed_get_environment_info",
+    "exposed_execute_python",
+    "exposed_get_module",
+    "exposed_call_function",
+)
+
+# Exposed DCCRPyCService methods a service may provide
+OPTIONAL_DCC_METHODS = (
+    "exposed_get_scene_info",
+    "exposed_get_session_info",
+    "exposed_create_primitive",
+    "exposed_get_actions",
+    "exposed_echo",
+    "exposed_add",
+    "exposed_execute_cmd",
+)
+
+
+def _as_action_result(result):
+    """Return ``result`` as an ActionResultModel, converting it from its dict form if needed."""
+    return result if isinstance(result, ActionResultModel) else ActionResultModel(**result)
 
 
 class TestDCCRPyCService:
     """Tests for the DCCRPyCService abstract base class."""
 
-    def test_interface_methods(self):
-        """Test that all abstract methods are implemented in MockDCCService."""
-        # Create an instance of MockDCCService
-        service = MockDCCService()
-
-        # Test that all required methods are implemented
-        assert hasattr(service, "get_application_info")
-        assert hasattr(service, "get_environment_info")
-        assert hasattr(service, "execute_python")
-        assert hasattr(service, "import_module")
-        assert hasattr(service, "call_function")
-        assert hasattr(service, "get_scene_info")
-        assert hasattr(service, "get_session_info")
-        assert hasattr(service, "create_primitive")
-
-    def test_get_application_info(self):
+    @pytest.mark.parametrize("method_name", INTERFACE_METHODS)
+    def test_interface_methods(self, dcc_service, method_name):
+        """Test that each abstract method of both service base classes is implemented in MockDCCService."""
+        assert hasattr(dcc_service, method_name)
+
+    def test_get_application_info(self, dcc_service):
         """Test get_application_info method."""
-        service = MockDCCService()
+        service = dcc_service
         info = service.get_application_info()
 
         # Verify the result structure
@@ -48,20 +78,13 @@ class TestDCCRPyCService:
         assert isinstance(info["platform"], str)
         assert isinstance(info["executable"], str)
 
-    def test_get_environment_info(self):
+    def test_get_environment_info(self, dcc_service):
         """Test get_environment_info method."""
-        service = MockDCCService()
+        service = dcc_service
         info = service.get_environment_info()
 
-        # Verify the result structure
-        assert "python_version" in info
-        assert "modules" in info
-        assert "sys_path" in info
-        assert "environment_variables" in info
-        assert "python_path" in info
-        assert "platform" in info
-        assert "cwd" in info
-        assert "os" in info
+        # Verify the result structure; the set difference reports every missing key at once
+        assert not ENVIRONMENT_INFO_KEYS - info.keys()
 
         # Verify the values
         assert info["python_version"] == sys.version
@@ -69,9 +92,9 @@ class TestDCCRPyCService:
         assert isinstance(info["sys_path"], list)
         assert isinstance(info["environment_variables"], dict)
 
-    def test_execute_python(self):
+    def test_execute_python(self, dcc_service):
         """Test execute_python method."""
-        service = MockDCCService()
+        service = dcc_service
 
         # Test simple execution
         result = service.execute_python("2 + 2")
@@ -87,9 +110,9 @@ class TestDCCRPyCService:
         assert "error" in result
         assert "division by zero" in result["error"]
 
-    def test_import_module(self):
+    def test_import_module(self, dcc_service):
         """Test import_module method."""
-        service = MockDCCService()
+        service = dcc_service
 
         # Test importing a standard module
         result = service.import_module("os")
@@ -101,9 +124,9 @@ class TestDCCRPyCService:
         assert "error" in result
         assert "non_existent_module" in result["error"]
 
-    def test_call_function(self):
+    def test_call_function(self, dcc_service):
         """Test call_function method."""
-        service = MockDCCService()
+        service = dcc_service
 
         # Test calling a function from a standard module
         result = service.call_function("os.path", "join", "dir", "file.txt")
@@ -115,16 +138,12 @@ class TestDCCRPyCService:
         assert isinstance(result, dict)
         assert "error" in result
 
-    def test_get_scene_info(self):
+    def test_get_scene_info(self, dcc_service):
         """Test get_scene_info method."""
-        service = MockDCCService()
+        service = dcc_service
         result = service.get_scene_info()
 
-        # Convert result to ActionResultModel for easier testing
-        if not isinstance(result, ActionResultModel):
-            # If it's a dict, convert it to an ActionResultModel
-            if isinstance(result, dict):
-                result = ActionResultModel(**result)
+        result = _as_action_result(result)
 
         # Verify the result
         assert result.success is True
@@ -134,16 +153,12 @@ class TestDCCRPyCService:
         assert "modified" in result.context
         assert "objects" in result.context
 
-    def test_get_session_info(self):
+    def test_get_session_info(self, dcc_service):
         """Test get_session_info method."""
-        service = MockDCCService()
+        service = dcc_service
         result = service.get_session_info()
 
-        # Convert result to ActionResultModel for testing
-        if isinstance(result, dict):
-            # If it's a dictionary, convert it to an ActionResultModel
-            if isinstance(result, dict):
-                result = ActionResultModel(**result)
+        result = _as_action_result(result)
 
         # Verify the result
         assert result.success is True
@@ -158,9 +173,9 @@ class TestDCCRPyCService:
         assert "scene" in context
         assert isinstance(context["scene"], dict)
 
-    def test_create_primitive(self):
+    def test_create_primitive(self, dcc_service):
         """Test create_primitive method."""
-        service = MockDCCService()
+        service = dcc_service
         result = service.create_primitive("cube", size=1.0)
 
         # Convert result to ActionResultModel for testing
@@ -186,51 +201,15 @@ class TestDCCRPyCService:
 class TestApplicationRPyCService:
     """Tests for the ApplicationRPyCService abstract base class."""
 
-    def test_interface_methods(self):
-        """Test that all abstract methods are implemented in MockDCCService."""
-        # MockDCCService also implements ApplicationRPyCService
-        service = MockDCCService()
-
-        # Test that all required methods are implemented
-        assert hasattr(service, "get_application_info")
-        assert hasattr(service, "get_environment_info")
-        assert hasattr(service, "execute_python")
-        assert hasattr(service, "import_module")
-        assert hasattr(service, "call_function")
-
-    def test_exposed_methods(self):
-        """Test that the service has the expected exposed methods."""
-        # Create a service instance for testing
-        service = MockDCCService()
-
-        # Check required ApplicationRPyCService methods
-        required_app_methods = [
-            "exposed_get_application_info",
-            "exposed_get_environment_info",
-            "exposed_execute_python",
-            "exposed_get_module",
-            "exposed_call_function",
-        ]
-
-        for method_name in required_app_methods:
-            assert hasattr(service, method_name), f"Missing required method: {method_name}"
-            assert callable(getattr(service, method_name)), f"Method is not callable: {method_name}"
-
-        # Check required DCCRPyCService methods
-        required_dcc_methods = [
-            "exposed_get_scene_info",
-            "exposed_get_session_info",
-            "exposed_create_primitive",
-            "exposed_get_actions",
-            "exposed_echo",
-            "exposed_add",
-            "exposed_execute_cmd",
-        ]
-
-        for method_name in required_dcc_methods:
-            # If the method is not implemented, skip it
-            if not hasattr(service, method_name):
-                print(f"Warning: Optional method {method_name} is not implemented")
-                continue
-
-            assert callable(getattr(service, method_name)), f"Method is not callable: {method_name}"
+    @pytest.mark.parametrize("method_name", REQUIRED_APP_METHODS)
+    def test_required_exposed_methods(self, dcc_service, method_name):
+        """Test that the service implements each required exposed method."""
+        assert callable(getattr(dcc_service, method_name, None)), f"Missing required method: {method_name}"
+
+    @pytest.mark.parametrize("method_name", OPTIONAL_DCC_METHODS)
+    def test_optional_exposed_methods(self, dcc_service, method_name):
+        """Test that each optional DCC method the service implements is callable."""
+        if not hasattr(dcc_service, method_name):
+            pytest.skip(f"Optional method {method_name} is not implemented")
+
+        assert callable(getattr(dcc_service, method_name)), f"Method is not callable: {method_name}"
@@ -3,9 +3,6 @@
 This module contains basic tests for the server.py module.
 """
 
-# Import built-in modules
-from unittest import mock
-
 # Import third-party modules
 import rpyc
 from rpyc.core import service
@@ -13,8 +10,6 @@ from rpyc.core import service
 # Import local modules
 from dcc_mcp_ipc.server import BaseRPyCService
 from dcc_mcp_ipc.server import DCCServer
-from dcc_mcp_ipc.server import create_service_factory
-from dcc_mcp_ipc.server import create_shared_service_instance
 
 
 class TestBaseRPyCService:
@@ -55,46 +50,3 @@ class TestDCCServerClass:
         assert hasattr(server.lock, "release")
         assert server.registry_file is None
         assert isinstance(server.clients, list)
-
-
-class TestServiceFactoryFunctions:
-    """Tests for the service factory functions."""
-
-    def test_create_service_factory(self):
-        """Test create_service_factory function."""
-        # Create a service factory
-        factory = create_service_factory(BaseRPyCService)
-
-        # Verify the factory is callable
-        assert callable(factory)
-
-        # Create a mock connection
-        conn = mock.MagicMock()
-
-        # Create a service instance using the factory
-        service_instance = factory(conn)
-
-        # Verify the service instance was created correctly
-        assert isinstance(service_instance, BaseRPyCService)
-
-    def test_create_shared_service_instance(self):
-        """Test create_shared_service_instance function."""
-        # Create a shared service instance
-        shared_instance = create_shared_service_instance(BaseRPyCService)
-
-        # Verify the shared instance is callable
-        assert callable(shared_instance)
-
-        # Create mock connections
-        conn1 = mock.MagicMock()
-        conn2 = mock.MagicMock()
-
-        # Create service instances using the shared instance
-        service_instance1 = shared_instance(conn1)
-        service_instance2 = shared_instance(conn2)
-
-        # Verify the service instances are the same object
-        assert service_instance1 is service_instance2
-
-        # Verify the service instance was created correctly
-        assert isinstance(service_instance1, BaseRPyCService)
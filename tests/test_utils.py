@@ -26,13 +26,13 @@ def create_service_class():
     return BaseRPyCService
 
 
-def create_dcc_server(dcc_name="test_dcc", host="localhost", port=0):
+def create_dcc_server(dcc_name="test_dcc", host="127.0.0.1", port=0):
     """Create a DCCServer instance for testing.
 
     Args:
     ----
         dcc_name: Name of the DCC (default: "test_dcc")
-        host: Host to bind the server to (default: "localhost")
+        host: Host to bind the server to (default: "127.0.0.1", which skips name resolution)
         port: Port to bind the server to (default: 0)
 
     Returns:
@@ -71,8 +71,4 @@ def setup_server_for_start(server, port=12345):
     # Mock the _create_server method to return our mock server
     server._create_server = mock.MagicMock(return_value=mock_server)
 
-    # Mock register_dcc_service to return a mock registry file
-    with mock.patch("dcc_mcp_ipc.server.register_dcc_service", return_value="/tmp/test_registry.json"):
-        pass
-
     return server, mock_server
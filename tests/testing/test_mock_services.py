@@ -361,6 +361,12 @@ class TestExposedGetActions:
         assert "create_primitive" in result["actions"]
         assert "get_scene_info" in result["actions"]
 
+    def test_actions_are_the_shared_catalogue(self):
+        svc = _make_service()
+        first = svc.exposed_get_actions()
+        assert first is not svc.exposed_get_actions()
+        assert first["actions"] is svc.exposed_get_actions()["actions"]
+
 
 # ---------------------------------------------------------------------------
 # MockDCCService - exposed_call_action
@@ -419,6 +425,17 @@ class TestExposedEchoAdd:
         result = svc.exposed_add(1.5, 2.5)
         assert abs(result - 4.0) < 1e-9
 
+    @pytest.mark.parametrize(
+        ("method_name", "args", "expected"),
+        [
+            ("exposed_echo", ("test",), "test"),
+            ("exposed_add", (1, 2), 3),
+        ],
+    )
+    def test_root_methods_over_rpyc(self, dcc_client, method_name, args, expected):
+        """Exposed methods dispatch over a live connection shared by every case in the module."""
+        assert dcc_client.execute_with_connection(lambda conn: getattr(conn.root, method_name)(*args)) == expected
+
 
 # ---------------------------------------------------------------------------
 # MockDCCService - exposed_execute_dcc_command
@@ -464,6 +481,12 @@ class TestExposedGetDccInfo:
         assert "platform" in result
         assert "python_version" in result
 
+    def test_each_call_returns_a_new_dict(self):
+        svc = _make_service()
+        first = svc.exposed_get_dcc_info()
+        first["version"] = "changed"
+        assert svc.exposed_get_dcc_info()["version"] == "1.0.0"
+
 
 # ---------------------------------------------------------------------------
 # start_mock_dcc_service / stop_mock_dcc_service / stop_all_mock_services
@@ -537,3 +560,24 @@ class TestMockServiceLifecycle:
 
         assert port == 11111
         ms._mock_servers.pop("test_dcc_zero_port", None)
+
+    def test_start_mock_dcc_service_raises_when_server_never_listens(self):
+        """A server that never starts listening is stopped and reported instead of returned."""
+        # Import local modules
+        from dcc_mcp_ipc.testing import mock_services as ms
+        from dcc_mcp_ipc.testing.mock_services import start_mock_dcc_service
+
+        mock_server = MagicMock()
+        mock_server.port = 22222
+        mock_server.active = False
+        mock_registry = MagicMock()
+
+        with patch("dcc_mcp_ipc.testing.mock_services.MockDCCService", return_value=MagicMock()):
+            with patch("dcc_mcp_ipc.testing.mock_services.ThreadedServer", return_value=mock_server):
+                with patch("dcc_mcp_ipc.testing.mock_services.ServiceRegistry", return_value=mock_registry):
+                    with patch("dcc_mcp_ipc.testing.mock_services.SERVER_START_TIMEOUT", 0.05):
+                        with pytest.raises(RuntimeError, match="did not start listening"):
+                            start_mock_dcc_service("test_dcc_never_listens", host="localhost", port=0)
+
+        mock_server.close.assert_called_once()
+        assert "test_dcc_never_listens" not in ms._mock_servers
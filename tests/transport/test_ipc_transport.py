@@ -12,6 +12,7 @@ from unittest.mock import patch
 import pytest
 
 # Import local modules
+from dcc_mcp_ipc.server.server_utils import poll_for
 from dcc_mcp_ipc.transport.base import ConnectionError
 from dcc_mcp_ipc.transport.base import ProtocolError
 from dcc_mcp_ipc.transport.base import TimeoutError
@@ -330,10 +331,5 @@ class TestIpcServerTransport:
             server = IpcServerTransport(MagicMock(), handler=handler)
             server.start()
 
-        # Wait briefly for background thread
-        # Import built-in modules
-        import time
-
-        time.sleep(0.1)
-
-        assert mock_channel in received
+        # Wait for the background thread to hand the channel to the handler
+        assert poll_for(lambda: mock_channel in received, timeout=2.0)
@@ -2,7 +2,6 @@
 
 # Import built-in modules
 from unittest.mock import MagicMock
-from unittest.mock import patch
 
 # Import third-party modules
 import pytest
@@ -23,6 +22,7 @@ class TestRPyCTransportConfig:
         assert config.sync_request_timeout == 30.0
         assert config.allow_all_attrs is True
         assert config.allow_public_attrs is True
+        assert config.keepalive is True
         assert config.host == "localhost"
 
     def test_custom_config(self):
@@ -58,26 +58,43 @@ class TestRPyCTransport:
         assert transport.rpyc_config.host == "test"
         assert transport.rpyc_config.port == 1234
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_connect_success(self, mock_rpyc):
+    def test_connect_success(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport(host="localhost", port=18812)
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         assert transport.state == TransportState.CONNECTED
         assert transport.is_connected
         assert transport.connection is mock_conn
-        mock_rpyc.connect.assert_called_once()
+        mock_connect.assert_called_once()
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_connect_failure(self, mock_rpyc):
-        mock_rpyc.connect.side_effect = OSError("Connection refused")
+    def test_default_connect_func_binds_keepalive(self):
+        assert RPyCTransport()._connect_func.keywords == {"keepalive": True}
+        assert self._make_transport(keepalive=False)._connect_func.keywords == {"keepalive": False}
+
+    def test_connect_with_custom_connect_func(self):
+        """A replacement connect function is called without a keepalive argument."""
+        mock_conn = MagicMock()
+
+        def custom_connect(host, port, config=None):
+            return mock_conn
+
+        transport = self._make_transport()
+        transport._connect_func = custom_connect
+        transport.connect()
+
+        assert transport.connection is mock_conn
+
+    def test_connect_failure(self):
+        mock_connect = MagicMock()
+        mock_connect.side_effect = OSError("Connection refused")
 
         transport = self._make_transport(host="bad-host", port=9999)
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
 
         with pytest.raises(ConnectionError, match="Failed to connect"):
             transport.connect()
@@ -85,25 +102,25 @@ class TestRPyCTransport:
         assert transport.state == TransportState.ERROR
         assert transport.connection is None
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_connect_already_connected(self, mock_rpyc):
+    def test_connect_already_connected(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
         # Second connect should be a no-op
         transport.connect()
-        assert mock_rpyc.connect.call_count == 1
+        assert mock_connect.call_count == 1
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_disconnect(self, mock_rpyc):
+    def test_disconnect(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
         transport.disconnect()
 
@@ -116,39 +133,39 @@ class TestRPyCTransport:
         transport.disconnect()  # should not raise
         assert transport.state == TransportState.DISCONNECTED
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_disconnect_with_close_error(self, mock_rpyc):
+    def test_disconnect_with_close_error(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.close.side_effect = RuntimeError("close failed")
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
         transport.disconnect()  # should not raise
         assert transport.state == TransportState.DISCONNECTED
         assert transport.connection is None
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_health_check_connected(self, mock_rpyc):
+    def test_health_check_connected(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         assert transport.health_check() is True
         mock_conn.ping.assert_called_once()
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_health_check_ping_fails(self, mock_rpyc):
+    def test_health_check_ping_fails(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.ping.side_effect = RuntimeError("ping failed")
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         assert transport.health_check() is False
@@ -158,43 +175,43 @@ class TestRPyCTransport:
         transport = RPyCTransport()
         assert transport.health_check() is False
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_execute_exposed_method(self, mock_rpyc):
+    def test_execute_exposed_method(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.root.exposed_list_actions.return_value = {"actions": {"create_sphere": {}}}
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         result = transport.execute("list_actions")
         assert result == {"actions": {"create_sphere": {}}}
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_execute_method_not_found(self, mock_rpyc):
+    def test_execute_method_not_found(self):
         """Test that ProtocolError is raised when method doesn't exist on a spec'd mock."""
+        mock_connect = MagicMock()
         # Use a bare object as root spec so getattr returns None
         mock_conn = MagicMock()
         root_obj = object()  # no attributes at all
         mock_conn.root = root_obj
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         with pytest.raises(ProtocolError, match="has no method"):
             transport.execute("nonexistent_method")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_execute_non_dict_result(self, mock_rpyc):
+    def test_execute_non_dict_result(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.root.exposed_get_version.return_value = "2024.1"
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         result = transport.execute("get_version")
@@ -205,27 +222,27 @@ class TestRPyCTransport:
         with pytest.raises(ConnectionError, match="Not connected"):
             transport.execute("test")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_execute_remote_error(self, mock_rpyc):
+    def test_execute_remote_error(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.root.exposed_bad_action.side_effect = RuntimeError("DCC crash")
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         with pytest.raises(ProtocolError, match="Error executing"):
             transport.execute("bad_action")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_execute_python(self, mock_rpyc):
+    def test_execute_python(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.root.exposed_execute_python.return_value = 42
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         result = transport.execute_python("1 + 1")
@@ -236,14 +253,14 @@ class TestRPyCTransport:
         with pytest.raises(ConnectionError):
             transport.execute_python("x = 1")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_call_function(self, mock_rpyc):
+    def test_call_function(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_conn.root.exposed_call_function.return_value = "/tmp/test"
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         result = transport.call_function("os.path", "join", "/tmp", "test")
@@ -255,15 +272,15 @@ class TestRPyCTransport:
         with pytest.raises(ConnectionError):
             transport.call_function("os", "getcwd")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_import_module(self, mock_rpyc):
+    def test_import_module(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
         mock_module = MagicMock()
         mock_conn.root.exposed_get_module.return_value = mock_module
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         result = transport.import_module("maya.cmds")
@@ -274,13 +291,13 @@ class TestRPyCTransport:
         with pytest.raises(ConnectionError):
             transport.import_module("os")
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_root_property(self, mock_rpyc):
+    def test_root_property(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         transport = self._make_transport()
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
         transport.connect()
 
         assert transport.root is mock_conn.root
@@ -290,14 +307,14 @@ class TestRPyCTransport:
         with pytest.raises(ConnectionError):
             _ = transport.root
 
-    @patch("dcc_mcp_ipc.transport.rpyc_transport.rpyc")
-    def test_context_manager(self, mock_rpyc):
+    def test_context_manager(self):
+        mock_connect = MagicMock()
         mock_conn = MagicMock()
-        mock_rpyc.connect.return_value = mock_conn
+        mock_connect.return_value = mock_conn
 
         config = RPyCTransportConfig(host="localhost", port=18812)
         transport = RPyCTransport(config)
-        transport._connect_func = mock_rpyc.connect
+        transport._connect_func = mock_connect
 
         with transport as t:
             assert t.is_connected
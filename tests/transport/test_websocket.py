@@ -722,7 +722,7 @@ class TestWebSocketReaderLoopEdgeCases:
         writer = threading.Thread(target=t._writer_loop, daemon=True)
         writer.start()
 
-        time.sleep(0.05)
+        # The writer blocks on the queue, so it sees _ws as None once the message arrives
         t._ws = None
         t._send_queue.put('{"test": true}')
 
@@ -813,8 +813,8 @@ class TestWebSocketDisconnectWithThreads:
         # Start a reader thread manually
         t._reader_thread = threading.Thread(target=t._reader_loop, daemon=True)
         t._reader_thread.start()
-        time.sleep(0.05)
 
+        # disconnect() joins the thread itself; no settling delay is needed
         t.disconnect()
         # After disconnect, reader_thread should be None (joined and cleaned up)
         assert t._reader_thread is None
@@ -828,8 +828,8 @@ class TestWebSocketDisconnectWithThreads:
         # Start a writer thread manually
         t._writer_thread = threading.Thread(target=t._writer_loop, daemon=True)
         t._writer_thread.start()
-        time.sleep(0.05)
 
+        # disconnect() joins the thread itself; no settling delay is needed
         t.disconnect()
         assert t._writer_thread is None
 
@@ -145,51 +145,27 @@ class TestWithResultConversion:
 class TestWithInfo:
     """Tests for the with_info decorator factory."""
 
-    def _make_obj_with_info(self, info_value):
+    @pytest.mark.parametrize(
+        "return_value,info_key,info,result_key,expected",
+        [
+            ({"result": "done"}, "app_info", {"name": "maya"}, "result", "done"),
+            (ActionResultModel(success=True, message="ok"), "dcc_info", {"version": "2024"}, "message", "ok"),
+            ("plain_string", "meta", {"x": 1}, "result", "plain_string"),
+        ],
+        ids=["dict", "action_result_model", "non_dict"],
+    )
+    def test_adds_info_to_result(self, return_value, info_key, info, result_key, expected):
         class Obj:
             def get_info(self):
-                return info_value
+                return info
 
-            @with_info(lambda self: self.get_info(), "app_info")
+            @with_info(lambda self: self.get_info(), info_key)
             def do_work(self):
-                return {"result": "done"}
+                return return_value
 
-        return Obj()
-
-    def test_adds_info_to_dict_result(self):
-        obj = self._make_obj_with_info({"name": "maya"})
-        result = obj.do_work()
-        assert "app_info" in result
-        assert result["app_info"]["name"] == "maya"
-        assert result["result"] == "done"
-
-    def test_works_with_action_result_model(self):
-        class Obj:
-            def get_info(self):
-                return {"version": "2024"}
-
-            @with_info(lambda self: self.get_info(), "dcc_info")
-            def do_work(self):
-                return ActionResultModel(success=True, message="ok")
-
-        obj = Obj()
-        result = obj.do_work()
-        assert "dcc_info" in result
-        assert result["dcc_info"]["version"] == "2024"
-
-    def test_works_with_non_dict_result(self):
-        class Obj:
-            def get_info(self):
-                return {"x": 1}
-
-            @with_info(lambda self: self.get_info(), "meta")
-            def do_work(self):
-                return "plain_string"
-
-        obj = Obj()
-        result = obj.do_work()
-        assert "meta" in result
-        assert result["result"] == "plain_string"
+        result = Obj().do_work()
+        assert result[info_key] == info
+        assert result[result_key] == expected
 
     def test_exception_in_func_propagates(self):
         class Obj:
@@ -2,13 +2,19 @@
 
 # Import built-in modules
 import logging
+import socket
+import threading
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 # Import third-party modules
 import pytest
+import rpyc
+from rpyc.utils.server import ThreadedServer
 
 # Import local modules
+from dcc_mcp_ipc.server.server_utils import poll_for
+from dcc_mcp_ipc.utils.rpyc_utils import connect_nodelay
 from dcc_mcp_ipc.utils.rpyc_utils import deliver_parameters
 from dcc_mcp_ipc.utils.rpyc_utils import execute_remote_command
 
@@ -126,3 +132,31 @@ class TestExecuteRemoteCommand:
 
         with pytest.raises(RuntimeError, match="remote crash"):
             execute_remote_command(mock_conn, "bad_cmd")
+
+
+class TestConnectNodelay:
+    """Tests for the connect_nodelay function."""
+
+    def test_connects_with_tcp_nodelay(self):
+        server = ThreadedServer(rpyc.SlaveService, hostname="127.0.0.1", port=0)
+        thread = threading.Thread(target=server.start, daemon=True)
+        thread.start()
+        assert poll_for(lambda: server.active)
+        try:
+            conn = connect_nodelay("127.0.0.1", server.port, config={"sync_request_timeout": 5})
+            try:
+                sock = conn._channel.stream.sock
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+                conn.ping()
+            finally:
+                conn.close()
+        finally:
+            server.close()
+            thread.join(timeout=1.0)
+
+    def test_connection_refused_raises(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        with pytest.raises(OSError):
+            connect_nodelay("127.0.0.1", port)